@@ -0,0 +1,96 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import pandas as pd
+from fake_graph_server import FakeGraphServer, csv_bytes
+
+def measure(server, name: str, size, func):
+    """Run `func` once against `server` and return its request count, bytes and wall time."""
+    server.reset_stats()
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    stats = server.stats()
+    return {
+        'method': name,
+        'size': size,
+        'requests': stats['requests'],
+        'bytes_in': stats['bytes_in'],
+        'bytes_out': stats['bytes_out'],
+        'seconds': round(seconds, 4),
+    }
+
+def run_benchmarks(sizes: list, file_sizes: list, latency: float = 0.0, page_size: int = 200, throttle_every: int = 0, audit: bool = False):
+    """
+    Benchmark the public `microsoft_sharepoint` methods against a local fake Graph server.
+
+    `sizes` scale the number of files, groups, list items and rows, `file_sizes` the bytes per file
+    read or uploaded. With `audit=True` every call also flushes its audit record to the log workbook.
+
+    Returns:
+        DataFrame: requests, bytes in/out and wall time per method and size.
+    """
+    results = []
+    upload_dir = tempfile.mkdtemp(dir='.')
+    try:
+        for size in sizes:
+            with FakeGraphServer(latency=latency, page_size=page_size, throttle_every=throttle_every, retry_after=0) as server:
+                server.add_files('Shared Document/Bench', size, 256)
+                server.add_files('Shared Document/Tree', size, 256, subfolders=max(1, size // 50))
+                server.add_groups(size, members_per_group=50)
+                server.add_list('Bench List', [{'Title': f'Item {i}', 'Value': i} for i in range(size)])
+                staff = pd.DataFrame({'email': [f'user{i}@example.com' for i in range(size)], 'object_id': [f'object-{i}' for i in range(size)]})
+                server.add_file('Shared Document/All Employee/All Staff.csv', staff.to_csv(index=False).encode('utf-8'))
+                sp = server.client(audit_remote=audit, audit_batch_size=1)
+                sp.get_token()
+                emails = list(staff['email'])
+                frame = pd.DataFrame({'id': range(size), 'name': [f'name{i}' for i in range(size)]})
+                results += [
+                    measure(server, 'list_files', size, lambda: sp.list_files(parentFolderName='Shared Document/Bench')),
+                    measure(server, 'crawl_folder', size, lambda: list(sp.crawl_folder('Shared Document/Tree'))),
+                    measure(server, 'get_file_path', size, lambda: sp.get_file_path(None, 'Shared Document/Tree', layer=2)),
+                    measure(server, 'read_sharepoint_list', size, lambda: sp.read_sharepoint_list(listName='Bench List')),
+                    measure(server, 'get_group_details', size, lambda: sp.get_group_details()),
+                    measure(server, 'get_groupmember_details', size, lambda: sp.get_groupmember_details(group_name=[f'Group {i}' for i in range(min(size, 20))])),
+                    measure(server, 'add_member_into_group', size, lambda: sp.add_member_into_group(group_name='Group 0', email=emails)),
+                    measure(server, 'add_member_into_group(bulk)', size, lambda: sp.add_member_into_group(group_name='Group 0', email=emails, bulk=True)),
+                    measure(server, 'update_same_file', size, lambda: sp.update_same_file(frame, fileName='Bench.xlsx', parentFolderName='Shared Document/Bench')),
+                ]
+                sp.close()
+        for file_size in file_sizes:
+            with FakeGraphServer(latency=latency, page_size=page_size, throttle_every=throttle_every, retry_after=0) as server:
+                server.add_file('Shared Document/Files/read.csv', csv_bytes(file_size))
+                with open(os.path.join(upload_dir, 'upload.csv'), 'wb') as f:
+                    f.write(csv_bytes(file_size))
+                sp = server.client(audit_remote=audit, audit_batch_size=1)
+                sp.get_token()
+                upload_kwargs = {'fileName': 'upload.csv', 'parentFolderName': 'Shared Document/Files', 'fileLocated': f'/{os.path.basename(upload_dir)}'}
+                results += [
+                    measure(server, 'read_item', file_size, lambda: sp.read_item(fileName='read.csv', parentFolderName='Shared Document/Files')),
+                    measure(server, 'read_item2', file_size, lambda: sp.read_item2(filePath='Shared Document/Files/read.csv')),
+                    measure(server, 'read_item_chunks', file_size, lambda: sum(len(chunk) for chunk in sp.read_item_chunks(filePath='Shared Document/Files/read.csv'))),
+                    measure(server, 'download_item', file_size, lambda: sp.download_item(fileName='read.csv', parentFolderName='Shared Document/Files', folderName=upload_dir)),
+                    measure(server, 'upload_item', file_size, lambda: sp.upload_item(**upload_kwargs)),
+                    measure(server, 'upload_item(large_file)', file_size, lambda: sp.upload_item(large_file=True, **upload_kwargs)),
+                ]
+                sp.close()
+    finally:
+        shutil.rmtree(upload_dir, ignore_errors=True)
+    return pd.DataFrame(results)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark lib_microsoft against a local fake Graph server.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--file-sizes', type=int, nargs='+', default=[10 * 1024, 1024 * 1024, 10 * 1024 * 1024])
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every request')
+    parser.add_argument('--page-size', type=int, default=200)
+    parser.add_argument('--throttle-every', type=int, default=0, help='Answer every n-th request with 429')
+    parser.add_argument('--audit', action='store_true', help='Write every audit record to the log workbook')
+    parser.add_argument('--output', help='Also write the results to this csv file')
+    args = parser.parse_args()
+    results = run_benchmarks(args.sizes, args.file_sizes, args.latency, args.page_size, args.throttle_every, args.audit)
+    print(results.to_string(index=False))
+    if args.output:
+        results.to_csv(args.output, index=False)
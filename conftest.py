@@ -0,0 +1,20 @@
+import pytest
+from fake_graph_server import FakeGraphServer
+from lib_microsoft import token_cache
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+@pytest.fixture
+def server():
+    with FakeGraphServer(retry_after=0) as server:
+        yield server
+
+@pytest.fixture
+def sp(server):
+    client = server.client()
+    yield client
+    client.close()
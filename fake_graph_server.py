@@ -0,0 +1,447 @@
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs, unquote, quote
+from collections import Counter
+import threading
+import hashlib
+import json
+import time
+import re
+from lib_microsoft import microsoft_sharepoint
+
+class FakeGraphServer:
+    """
+    Local stand-in for the Microsoft Graph and login endpoints used by `microsoft_sharepoint`.
+
+    The drive, workbooks, lists, groups and members live in memory. Latency is added to every request,
+    collections are paged by `page_size`, and every `throttle_every`-th request is answered with
+    429 + Retry-After. Request counts and bytes in/out are recorded per route for benchmarks.
+
+    For failure tests, the next `fail_chunks` upload chunks are stored but answered with 500 (a lost
+    acknowledgement), $batch sub-requests whose id is in `throttled_batch_ids` are answered once with
+    429, routes named in `route_errors` are answered with the mapped status code, and every workbook
+    range write is recorded in `range_writes`.
+
+    Usage:
+        with FakeGraphServer(latency=0.02) as server:
+            server.add_files('Shared Document/Reports', count=500, size=1024)
+            sp = server.client()
+            sp.list_files(parentFolderName='Shared Document/Reports')
+            print(server.stats())
+    """
+    routes = [
+        ('token', 'POST', r'^/([^/]+)/oauth2/v2\.0/token$'),
+        ('children', 'GET', r'^/v1\.0/sites/([^/]+)/drive/root:/(.*?):/children$'),
+        ('content', 'GET', r'^/v1\.0/sites/([^/]+)/drive/root:/(.*?):/content$'),
+        ('upload', 'PUT', r'^/v1\.0/sites/([^/]+)/drive/root:/(.*?):/content$'),
+        ('upload_session', 'POST', r'^/v1\.0/sites/([^/]+)/drive/root:/(.*?):/createUploadSession$'),
+        ('workbook_session', 'POST', r'^/v1\.0/sites/([^/]+)/drive/root:/(.*?):/workbook/(createSession|closeSession)$'),
+        ('used_range', 'GET', r"^/v1\.0/sites/([^/]+)/drive/root:/(.*?):/workbook/worksheets\('(.*?)'\)/usedRange.*$"),
+        ('range_clear', 'POST', r"^/v1\.0/sites/([^/]+)/drive/root:/(.*?):/workbook/worksheets\('(.*?)'\)/range\(address='(.*?)'\)/clear$"),
+        ('range_update', 'PATCH', r"^/v1\.0/sites/([^/]+)/drive/root:/(.*?):/workbook/worksheets\('(.*?)'\)/range\(address='(.*?)'\)$"),
+        ('drive_delta', 'GET', r'^/v1\.0/sites/([^/]+)/drive/root/delta$'),
+        ('metadata', 'GET', r'^/v1\.0/sites/([^/]+)/drive/root:/(.*?):/?$'),
+        ('item_content', 'GET', r'^/v1\.0/sites/([^/]+)/drive/items/([^/]+)/content$'),
+        ('lists', 'GET', r'^/v1\.0/sites/([^/]+)/lists$'),
+        ('list_items', 'GET', r'^/v1\.0/sites/([^/]+)/lists/([^/]+)/items$'),
+        ('library_drive_item', 'GET', r'^/v1\.0/sites/([^/]+)/lists/([^/]+)/items/([^/]+)/driveItem$'),
+        ('library_delete', 'DELETE', r'^/v1\.0/sites/([^/]+)/lists/([^/]+)/items/([^/]+)$'),
+        ('groups', 'GET', r'^/v1\.0/groups(/delta)?$'),
+        ('members', 'GET', r'^/v1\.0/groups/([^/]+)/members$'),
+        ('member_add', 'POST', r'^/v1\.0/groups/([^/]+)/members/\$ref$'),
+        ('member_remove', 'DELETE', r'^/v1\.0/groups/([^/]+)/members/([^/]+)/\$ref$'),
+        ('batch', 'POST', r'^/v1\.0/\$batch$'),
+        ('download', 'GET', r'^/download/([^/]+)$'),
+        ('chunk', 'PUT', r'^/upload/([^/]+)$'),
+        ('chunk_status', 'GET', r'^/upload/([^/]+)$'),
+    ]
+
+    def __init__(self, latency: float = 0.0, page_size: int = 200, throttle_every: int = 0, retry_after: int = 1, site_id: str = 'fake-site', host: str = '127.0.0.1', port: int = 0):
+        self.latency = latency
+        self.page_size = page_size
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.site_id = site_id
+        self.files = {}
+        self.versions = {}
+        self.library_items = {}
+        self.used_rows = {}
+        self.lists = {}
+        self.groups = []
+        self.members = {}
+        self.upload_sessions = {}
+        self.changes = {}
+        self.removed = {}
+        self.change_seq = 0
+        self.range_writes = []
+        self.fail_chunks = 0
+        self.throttled_batch_ids = set()
+        self.route_errors = {}
+        self._lock = threading.Lock()
+        self._request_count = 0
+        self.reset_stats()
+        self.httpd = ThreadingHTTPServer((host, port), self.handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def client(self, **kwargs):
+        """A `microsoft_sharepoint` pointed at this server. The remote audit log is off unless `audit_remote=True`."""
+        config = {
+            'client_id': 'fake-client',
+            'client_secret': 'fake-secret',
+            'tenant_id': 'fake-tenant',
+            'site_id': self.site_id,
+            'list_id': 'fake-list',
+            'graph_url': f'{self.url}/v1.0',
+            'login_url': self.url,
+            'audit_remote': False,
+            **kwargs
+        }
+        return microsoft_sharepoint(**config)
+
+    def reset_stats(self):
+        with self._lock:
+            self.requests = Counter()
+            self.bytes_in = 0
+            self.bytes_out = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'requests': sum(self.requests.values()),
+                'bytes_in': self.bytes_in,
+                'bytes_out': self.bytes_out,
+                'by_route': dict(self.requests),
+            }
+
+    def add_file(self, path: str, data: bytes):
+        path = path.strip('/')
+        with self._lock:
+            self.files[path] = bytes(data)
+            self.versions[path] = self.versions.get(path, 0) + 1
+            self.library_items.setdefault(path, str(len(self.library_items) + 1))
+            self.change_seq += 1
+            self.changes[path] = self.change_seq
+            self.removed.pop(path, None)
+
+    def remove_file(self, path: str):
+        path = path.strip('/')
+        with self._lock:
+            del self.files[path]
+            self.change_seq += 1
+            self.removed[path] = self.change_seq
+
+    def add_files(self, folder: str, count: int, size: int = 1024, extension: str = 'csv', subfolders: int = 0):
+        """Add `count` files of `size` bytes, spread over `subfolders` nested folders when given."""
+        for i in range(count):
+            parent = folder if not subfolders else f'{folder}/sub{i % subfolders}'
+            self.add_file(f'{parent}/file{i:06d}.{extension}', csv_bytes(size))
+
+    def add_list(self, displayName: str, rows: list):
+        list_id = hashlib.md5(displayName.encode('utf-8')).hexdigest()
+        self.lists[list_id] = {'name': displayName, 'displayName': displayName, 'rows': rows}
+        return list_id
+
+    def add_groups(self, count: int, members_per_group: int = 10):
+        for i in range(count):
+            group_id = f'group-{i:05d}'
+            self.groups.append({'id': group_id, 'displayName': f'Group {i}', 'mailEnabled': False, 'securityEnabled': True})
+            self.members[group_id] = [
+                {'@odata.type': '#microsoft.graph.user', 'id': f'user-{i:05d}-{j:05d}', 'displayName': f'User {j}',
+                 'mail': f'user{j}@example.com', 'userPrincipalName': f'user{j}@example.com', 'jobTitle': 'Analyst'}
+                for j in range(members_per_group)
+            ]
+
+    def item(self, path: str):
+        name = path.rsplit('/', 1)[-1]
+        parent = path.rsplit('/', 1)[0] if '/' in path else ''
+        item_id = hashlib.md5(path.encode('utf-8')).hexdigest()
+        tag = f'{item_id[:8]}-{item_id[8:12]}-{item_id[12:16]}-{item_id[16:20]}-{item_id[20:]}'.upper()
+        result = {
+            'id': item_id,
+            'name': name,
+            'eTag': f'"{{{tag}}},{self.versions.get(path, 1)}"',
+            'cTag': f'"c:{{{tag}}},{self.versions.get(path, 1)}"',
+            'lastModifiedDateTime': '2024-01-01T00:00:00Z',
+            'parentReference': {'path': f'/drive/root:/{parent}'},
+        }
+        if path in self.files:
+            result['size'] = len(self.files[path])
+            result['file'] = {}
+            result['@microsoft.graph.downloadUrl'] = f'{self.url}/download/{item_id}'
+        else:
+            result['folder'] = {}
+        return result
+
+    def children(self, folder: str):
+        folder = folder.strip('/')
+        prefix = f'{folder}/' if folder else ''
+        names = set()
+        for path in self.files:
+            if path.startswith(prefix):
+                names.add(prefix + path[len(prefix):].split('/', 1)[0])
+        return [self.item(path) for path in sorted(names)]
+
+    def delta_item(self, path: str):
+        """A driveItem as the delta query returns it: no parentReference.path, only the parent id."""
+        if not path:
+            return {'id': 'root', 'name': 'root', 'root': {}, 'folder': {}}
+        item = self.item(path)
+        parent = path.rsplit('/', 1)[0] if '/' in path else ''
+        item['parentReference'] = {'id': hashlib.md5(parent.encode('utf-8')).hexdigest() if parent else 'root'}
+        item.pop('@microsoft.graph.downloadUrl', None)
+        return item
+
+    def page(self, handler, values: list, query: dict):
+        step = min(int(query.get('$top', [self.page_size])[0]), self.page_size)
+        start = int(query.get('$skiptoken', [0])[0])
+        body = {'value': values[start:start + step]}
+        if start + step < len(values):
+            next_query = {k: v[0] for k, v in query.items() if k != '$skiptoken'}
+            next_query['$skiptoken'] = start + step
+            body['@odata.nextLink'] = f"{self.url}{quote(handler.route_path)}?" + '&'.join(f'{k}={v}' for k, v in next_query.items())
+        return body
+
+    def handle(self, handler, method: str):
+        path = unquote(urlsplit(handler.path).path)
+        query = parse_qs(urlsplit(handler.path).query)
+        handler.route_path = path
+        body = handler.rfile.read(int(handler.headers.get('Content-Length') or 0))
+        for name, route_method, pattern in self.routes:
+            match = re.match(pattern, path)
+            if route_method == method and match:
+                break
+        else:
+            name, match = None, None
+        with self._lock:
+            self._request_count += 1
+            self.requests[name or 'unknown'] += 1
+            self.bytes_in += len(body)
+            throttled = self.throttle_every and self._request_count % self.throttle_every == 0
+        if self.latency:
+            time.sleep(self.latency)
+        if throttled:
+            return 429, {'Retry-After': str(self.retry_after)}, {'error': {'code': 'TooManyRequests'}}
+        if name is None:
+            return 404, {}, {'error': {'code': 'itemNotFound', 'message': path}}
+        if name in self.route_errors:
+            return self.route_errors[name], {}, {'error': {'code': 'injectedFailure', 'message': path}}
+        return getattr(self, f'route_{name}')(handler, match, query, body)
+
+    def route_token(self, handler, match, query, body):
+        return 200, {}, {'token_type': 'Bearer', 'expires_in': 3599, 'access_token': 'fake-token'}
+
+    def route_children(self, handler, match, query, body):
+        return 200, {}, self.page(handler, self.children(match.group(2)), query)
+
+    def route_content(self, handler, match, query, body):
+        path = match.group(2).strip('/')
+        if path not in self.files:
+            return 404, {}, {'error': {'code': 'itemNotFound'}}
+        return 200, {'Content-Type': 'application/octet-stream'}, self.files[path]
+
+    def route_upload(self, handler, match, query, body):
+        path = match.group(2).strip('/')
+        self.add_file(path, body)
+        return 201, {}, self.item(path)
+
+    def route_upload_session(self, handler, match, query, body):
+        session_id = hashlib.md5(f'{match.group(2)}{time.time()}'.encode('utf-8')).hexdigest()
+        self.upload_sessions[session_id] = {'path': match.group(2).strip('/'), 'data': bytearray()}
+        return 200, {}, {'uploadUrl': f'{self.url}/upload/{session_id}', 'nextExpectedRanges': ['0-']}
+
+    def route_chunk(self, handler, match, query, body):
+        session = self.upload_sessions.get(match.group(1))
+        if session is None:
+            return 404, {}, {'error': {'code': 'itemNotFound'}}
+        start, end, total = map(int, re.match(r'bytes (\d+)-(\d+)/(\d+)', handler.headers['Content-Range']).groups())
+        if start != len(session['data']):
+            return 416, {}, {'error': {'code': 'invalidRange'}, 'nextExpectedRanges': [f"{len(session['data'])}-"]}
+        session['data'] += body
+        if self.fail_chunks:
+            self.fail_chunks -= 1
+            return 500, {}, {'error': {'code': 'generalException'}}
+        if len(session['data']) >= total:
+            self.add_file(session['path'], session['data'])
+            del self.upload_sessions[match.group(1)]
+            return 201, {}, self.item(session['path'])
+        return 202, {}, {'nextExpectedRanges': [f"{len(session['data'])}-"]}
+
+    def route_chunk_status(self, handler, match, query, body):
+        session = self.upload_sessions.get(match.group(1))
+        if session is None:
+            return 404, {}, {'error': {'code': 'itemNotFound'}}
+        return 200, {}, {'nextExpectedRanges': [f"{len(session['data'])}-"]}
+
+    def route_workbook_session(self, handler, match, query, body):
+        if match.group(3) == 'createSession':
+            return 201, {}, {'id': 'fake-session', 'persistChanges': True}
+        return 204, {}, None
+
+    def route_used_range(self, handler, match, query, body):
+        rows = self.used_rows.get((match.group(2), match.group(3)), 1)
+        return 200, {}, {'address': f'{match.group(3)}!A1:E{rows}'}
+
+    def route_range_clear(self, handler, match, query, body):
+        return 204, {}, None
+
+    def route_range_update(self, handler, match, query, body):
+        key = (match.group(2), match.group(3))
+        self.range_writes.append({'path': match.group(2), 'sheet': match.group(3), 'address': match.group(4), 'values': json.loads(body).get('values')})
+        end_row = int(re.search(r'(\d+)$', match.group(4)).group(1))
+        self.used_rows[key] = max(self.used_rows.get(key, 1), end_row)
+        return 200, {}, {'address': match.group(4)}
+
+    def route_drive_delta(self, handler, match, query, body):
+        # The token is the change sequence the previous delta round ended at
+        since = int(query.get('token', [0])[0])
+        with self._lock:
+            changed = sorted(path for path, seq in self.changes.items() if seq > since and path in self.files)
+            removed = sorted(path for path, seq in self.removed.items() if seq > since)
+            token = self.change_seq
+        paths = set()
+        for path in changed:
+            parts = path.split('/')
+            paths.update('/'.join(parts[:i]) for i in range(len(parts) + 1))
+        values = [self.delta_item(path) for path in sorted(paths, key=lambda path: path.count('/') if path else -1)]
+        values += [{'id': hashlib.md5(path.encode('utf-8')).hexdigest(), 'deleted': {'state': 'deleted'}} for path in removed]
+        body = self.page(handler, values, query)
+        if '@odata.nextLink' not in body:
+            body['@odata.deltaLink'] = f"{self.url}{quote(handler.route_path)}?token={token}"
+        return 200, {}, body
+
+    def route_metadata(self, handler, match, query, body):
+        path = match.group(2).strip('/')
+        if path not in self.files and not any(f.startswith(f'{path}/') for f in self.files):
+            return 404, {}, {'error': {'code': 'itemNotFound'}}
+        return 200, {}, self.item(path)
+
+    def route_item_content(self, handler, match, query, body):
+        return self.route_download(handler, match, query, body)
+
+    def route_download(self, handler, match, query, body):
+        for path in self.files:
+            if hashlib.md5(path.encode('utf-8')).hexdigest() == match.group(1):
+                return 200, {'Content-Type': 'application/octet-stream'}, self.files[path]
+        return 404, {}, {'error': {'code': 'itemNotFound'}}
+
+    def route_lists(self, handler, match, query, body):
+        return 200, {}, {'value': [{'id': list_id, 'name': l['name'], 'displayName': l['displayName']} for list_id, l in self.lists.items()]}
+
+    def route_list_items(self, handler, match, query, body):
+        rows = self.lists.get(match.group(2), {}).get('rows', [])
+        return 200, {}, self.page(handler, [{'id': str(i), 'fields': row} for i, row in enumerate(rows)], query)
+
+    def library_path(self, list_item_id: str):
+        """Path of the file whose document library list item id is `list_item_id`, or None."""
+        return next((path for path, item_id in self.library_items.items() if item_id == list_item_id and path in self.files), None)
+
+    def route_library_drive_item(self, handler, match, query, body):
+        path = self.library_path(match.group(3))
+        if path is None:
+            return 404, {}, {'error': {'code': 'itemNotFound'}}
+        return 200, {}, self.item(path)
+
+    def route_library_delete(self, handler, match, query, body):
+        path = self.library_path(match.group(3))
+        if path is None:
+            return 404, {}, {'error': {'code': 'itemNotFound'}}
+        self.remove_file(path)
+        return 204, {}, None
+
+    def route_groups(self, handler, match, query, body):
+        return 200, {}, self.page(handler, self.groups, query)
+
+    def route_members(self, handler, match, query, body):
+        return 200, {}, self.page(handler, self.members.get(match.group(1), []), query)
+
+    def route_member_add(self, handler, match, query, body):
+        return 204, {}, None
+
+    def route_member_remove(self, handler, match, query, body):
+        return 204, {}, None
+
+    def route_batch(self, handler, match, query, body):
+        requests = json.loads(body).get('requests', [])
+        responses = []
+        for r in requests:
+            if r['id'] in self.throttled_batch_ids:
+                self.throttled_batch_ids.discard(r['id'])
+                responses.append({'id': r['id'], 'status': 429, 'headers': {'Retry-After': '0'}, 'body': None})
+            else:
+                responses.append({'id': r['id'], 'status': 204, 'headers': {}, 'body': None})
+        return 200, {}, {'responses': responses}
+
+    def handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def respond(self, method):
+                status, headers, payload = server.handle(self, method)
+                if isinstance(payload, (bytes, bytearray)):
+                    data = bytes(payload)
+                else:
+                    data = b'' if payload is None else json.dumps(payload).encode('utf-8')
+                    headers = {'Content-Type': 'application/json', **headers}
+                with server._lock:
+                    server.bytes_out += len(data)
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self.respond('GET')
+
+            def do_POST(self):
+                self.respond('POST')
+
+            def do_PUT(self):
+                self.respond('PUT')
+
+            def do_PATCH(self):
+                self.respond('PATCH')
+
+            def do_DELETE(self):
+                self.respond('DELETE')
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+def csv_bytes(size: int):
+    """CSV content of roughly `size` bytes with a header row."""
+    header = b'id,name,value\n'
+    rows = []
+    total = len(header)
+    i = 0
+    while total < size:
+        row = f'{i},name{i},{i * 0.5}\n'.encode('utf-8')
+        rows.append(row)
+        total += len(row)
+        i += 1
+    return header + b''.join(rows)
@@ -1,18 +1,331 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import re
 import os
 import zipfile
 import json
 import inspect
+import getpass
+import threading
+import atexit
+import time
+import logging
+import weakref
 from dotenv import load_dotenv
 from io import BytesIO
+from collections import OrderedDict
 import base64
+import tempfile
+import fnmatch
+import hashlib
+import shutil
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import polars as pl
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+class TokenCache:
+    """
+    Thread-safe cache of OAuth access tokens keyed by (tenant_id, client_id).
+
+    Tokens are refreshed `refresh_margin` seconds before `expires_in` runs out.
+    """
+    def __init__(self, refresh_margin: int = 300):
+        self.refresh_margin = refresh_margin
+        self.hits = 0
+        self.misses = 0
+        self._tokens = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, key):
+        with self._lock:
+            token = self._tokens.get(key)
+            if token and token[1] - self.refresh_margin > time.time():
+                self.hits += 1
+                return token[0]
+            self.misses += 1
+            return None
+
+    def store(self, key, access_token: str, expires_in):
+        with self._lock:
+            self._tokens[key] = (access_token, time.time() + int(expires_in or 0))
+
+    def clear(self):
+        with self._lock:
+            self._tokens.clear()
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'cached': len(self._tokens)}
+
+token_cache = TokenCache()
+
+class AuditSink:
+    """
+    Buffers audit records in memory and hands them to `writer` in batches.
+
+    A batch is flushed once `batch_size` records are buffered or `flush_interval` seconds after the
+    last flush (checked by a background thread, so idle clients flush too), on `flush()` and at process
+    exit. A failed write is logged and the batch is kept; later attempts back off exponentially from
+    `retry_backoff` up to `max_backoff` seconds, and the error never reaches the caller. When
+    `local_path` is set every record is also appended to that file as one JSON line. A `writer` of
+    None keeps the records local only.
+
+    Sinks are tracked weakly: records still buffered when a client is garbage-collected without
+    `close()` are only kept in `local_path`.
+    """
+    def __init__(self, writer=None, batch_size: int = 50, flush_interval: int = 60, local_path: str = None, retry_backoff: int = 30, max_backoff: int = 900):
+        self.writer = writer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.local_path = local_path
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self.failures = 0
+        self._buffer = []
+        self._last_flush = time.time()
+        self._retry_at = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        register_audit_sink(self)
+
+    def add(self, record: dict):
+        if self.local_path:
+            with open(self.local_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, default=str) + '\n')
+        with self._lock:
+            self._buffer.append(record)
+        self.flush_if_due()
+
+    def due(self):
+        with self._lock:
+            now = time.time()
+            return (
+                bool(self._buffer)
+                and now >= self._retry_at
+                and (len(self._buffer) >= self.batch_size or now - self._last_flush >= self.flush_interval)
+            )
+
+    def flush_if_due(self):
+        if self.due():
+            self.flush()
+
+    def flush(self):
+        """Write the buffered records. Returns False if the writer failed and the records were kept."""
+        with self._flush_lock:
+            with self._lock:
+                records, self._buffer = self._buffer, []
+                self._last_flush = time.time()
+            if not records or self.writer is None:
+                return True
+            try:
+                self.writer(records)
+            except Exception as error:
+                # Keep the batch and back off so a broken log workbook doesn't slow down or break callers
+                with self._lock:
+                    self._buffer = records + self._buffer
+                    self.failures += 1
+                    backoff = min(self.retry_backoff * 2 ** (self.failures - 1), self.max_backoff)
+                    self._retry_at = time.time() + backoff
+                logger.warning('Failed to write %s audit records, retrying in %ss: %s', len(records), backoff, error)
+                return False
+            with self._lock:
+                self.failures = 0
+                self._retry_at = 0
+            return True
+
+_audit_sinks = weakref.WeakSet()
+_audit_sinks_lock = threading.Lock()
+_audit_thread = None
+
+def register_audit_sink(sink: AuditSink):
+    """Track `sink` for the interval flusher and the exit hook without keeping it (or its client) alive."""
+    global _audit_thread
+    with _audit_sinks_lock:
+        _audit_sinks.add(sink)
+        if _audit_thread is None:
+            _audit_thread = threading.Thread(target=_flush_due_audit_sinks, name='audit-flush', daemon=True)
+            _audit_thread.start()
+
+def _flush_due_audit_sinks(poll_interval: int = 1):
+    while True:
+        time.sleep(poll_interval)
+        for sink in list(_audit_sinks):
+            try:
+                sink.flush_if_due()
+            except Exception:
+                logger.exception('Audit flush failed')
+
+@atexit.register
+def _flush_audit_sinks():
+    for sink in list(_audit_sinks):
+        sink.flush()
+
+def column_letter(index: int):
+    """Convert a 1-based column index to an Excel column letter (1 -> A, 27 -> AA)."""
+    letters = ''
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+class DownloadCache:
+    """
+    On-disk cache of SharePoint files keyed by drive item id and validated against the item's cTag.
+
+    Files are touched on every hit and the least recently used ones are evicted once the cache grows
+    beyond `max_bytes`. Parsed DataFrames can be kept next to the raw file under their own suffix.
+    """
+    def __init__(self, cache_dir: str, max_bytes: int = 2 * 1024 ** 3):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+
+    def path(self, item_id: str, suffix: str = ''):
+        return os.path.join(self.cache_dir, f'{item_id}{suffix}')
+
+    def get(self, item_id: str, cTag: str, suffix: str = ''):
+        """Return the cached path of the item if it matches `cTag`, otherwise None."""
+        with self._lock:
+            path = self.path(item_id, suffix)
+            if self.index.get(item_id) != cTag or not os.path.exists(path):
+                return None
+            os.utime(path)
+            return path
+
+    def put(self, item_id: str, cTag: str, write, suffix: str = ''):
+        """Store a new copy written by `write(path)` and return its cached path."""
+        temp_path = self.path(item_id, f'{suffix}.{threading.get_ident()}.tmp')
+        write(temp_path)
+        with self._lock:
+            if self.index.get(item_id) != cTag:
+                # A new version of the item, drop the stale raw and parsed copies
+                for entry in os.scandir(self.cache_dir):
+                    if entry.name.startswith(item_id) and not entry.name.endswith('.tmp'):
+                        os.remove(entry.path)
+                self.index[item_id] = cTag
+            path = self.path(item_id, suffix)
+            os.replace(temp_path, path)
+            self.evict(keep=path)
+            with open(self.index_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f)
+        return path
+
+    def evict(self, keep: str = None):
+        """
+        Remove least recently used files until the cache fits in `max_bytes`. `keep` (the entry just
+        written) is never removed, even if it alone exceeds the limit; it goes on a later eviction.
+        """
+        entries = sorted(
+            (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+            for entry in os.scandir(self.cache_dir)
+            if entry.is_file() and entry.path != self.index_path and not entry.name.endswith('.tmp')
+        )
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            os.remove(path)
+            total -= size
+
+class ResolutionCache:
+    """
+    Thread-safe LRU cache with a time-to-live for resolved items.
+
+    Keys are ('path', site_id, path) or ('share', fileURL). Values are dicts such as the drive item id,
+    list item id, eTag, name and download url, merged as more of them become known.
+    """
+    def __init__(self, max_entries: int = 1024, ttl: int = 300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def update(self, key, **values):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            cached = entry[1] if entry is not None and entry[0] >= time.time() else {}
+            merged = {**cached, **values}
+            self._entries[key] = (time.time() + self.ttl, merged)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return merged
+
+    def invalidate(self, key=None, **values):
+        """Drop `key` and every entry holding any of the given field values."""
+        with self._lock:
+            self._entries.pop(key, None)
+            for cached_key, (_, cached) in list(self._entries.items()):
+                if any(v is not None and cached.get(k) == v for k, v in values.items()):
+                    del self._entries[cached_key]
+
+class DirectoryCache:
+    """
+    Shared, TTL-bound indexes of security groups (displayName -> id) and staff (email -> object_id).
+
+    Groups are kept current through the groups delta query, so a refresh only transfers changes.
+    """
+    def __init__(self, ttl: int = 900):
+        self.ttl = ttl
+        self.groups = {}
+        self.group_ids = {}
+        self.groups_delta_link = None
+        self.groups_refreshed_at = 0
+        self.staff_ids = {}
+        self.staff_refreshed_at = 0
+        self.lock = threading.Lock()
+
+    def groups_stale(self):
+        return time.time() - self.groups_refreshed_at >= self.ttl
+
+    def staff_stale(self):
+        return time.time() - self.staff_refreshed_at >= self.ttl
+
+    def apply_group_changes(self, changes: list):
+        for change in changes:
+            if '@removed' in change:
+                self.groups.pop(change['id'], None)
+                continue
+            group = {**self.groups.get(change['id'], {}), **change}
+            if group.get('securityEnabled') and not group.get('mailEnabled'):
+                self.groups[change['id']] = group
+            else:
+                self.groups.pop(change['id'], None)
+        self.group_ids = {group.get('displayName'): group_id for group_id, group in self.groups.items()}
+        self.groups_refreshed_at = time.time()
+
+    def set_staff(self, userDf: pd.DataFrame):
+        self.staff_ids = dict(zip(userDf['email'].str.lower(), userDf['object_id'].astype(str)))
+        self.staff_refreshed_at = time.time()
+
 @dataclass
 class microsoft_sharepoint:
     client_id: str = os.getenv('client_id')
@@ -20,7 +333,61 @@ class microsoft_sharepoint:
     tenant_id: str = os.getenv('tenant_id')
     site_id: str = os.getenv('site_id')
     list_id: str = os.getenv('list_id')
-    base_url: str = "https://graph.microsoft.com/v1.0/sites"
+    base_url: str = None
+    graph_url: str = "https://graph.microsoft.com/v1.0"
+    login_url: str = "https://login.microsoftonline.com"
+    pool_size: int = 10
+    throttle_retries: int = 3
+    audit_remote: bool = True
+    audit_local_path: str = None
+    audit_batch_size: int = 50
+    audit_flush_interval: int = 60
+    cache_dir: str = os.getenv('sharepoint_cache_dir')
+    cache_max_bytes: int = 2 * 1024 ** 3
+    resolution_ttl: int = 300
+    resolution_max_entries: int = 1024
+    directory_ttl: int = 900
+    session: requests.Session = field(default=None, init=False, repr=False)
+    audit_sink: AuditSink = field(default=None, init=False, repr=False)
+    download_cache: DownloadCache = field(default=None, init=False, repr=False)
+    resolution_cache: ResolutionCache = field(default=None, init=False, repr=False)
+    directory: DirectoryCache = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.base_url is None:
+            self.base_url = f"{self.graph_url}/sites"
+        # One keep-alive session per instance so Graph calls reuse pooled connections
+        self.session = requests.Session()
+        # Only throttled (429) and unavailable (503) responses are retried, after their Retry-After.
+        # Connection and read errors are not: a timed out POST/PATCH/PUT may already have been applied
+        retry = Retry(
+            total=None,
+            connect=0,
+            read=0,
+            other=0,
+            status=self.throttle_retries,
+            status_forcelist=[429, 503],
+            allowed_methods=None,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.audit_sink = AuditSink(
+            writer=self.write_log_records if self.audit_remote else None,
+            batch_size=self.audit_batch_size,
+            flush_interval=self.audit_flush_interval,
+            local_path=self.audit_local_path,
+        )
+        self.resolution_cache = ResolutionCache(self.resolution_max_entries, self.resolution_ttl)
+        self.directory = DirectoryCache(self.directory_ttl)
+        if self.cache_dir:
+            self.download_cache = DownloadCache(self.cache_dir, self.cache_max_bytes)
+
+    def close(self):
+        self.audit_sink.flush()
+        self.session.close()
 
     def get_token(self, **kwargs):
         client_id= self.client_id 
@@ -28,36 +395,58 @@ class microsoft_sharepoint:
         if kwargs.get('group') == 'P-Doo Clearing Global':
             client_id = os.getenv('pclear_client_id')
             client_secret = os.getenv('pclear_client_secret')
-        authUrl = f'https://login.microsoftonline.com/{self.tenant_id}/oauth2/v2.0/token'
-        body = {
-            'grant_type':'client_credentials',
-            'scope':'https://graph.microsoft.com/.default',
-            'client_id':client_id,
-            'client_secret':client_secret
-        }
-        response = requests.post(authUrl, data=body)
-        result = response.json()
-        access_token = result['access_token']
+        cache_key = (self.tenant_id, client_id)
+        access_token = token_cache.lookup(cache_key)
+        if access_token is None:
+            authUrl = f'{self.login_url}/{self.tenant_id}/oauth2/v2.0/token'
+            body = {
+                'grant_type':'client_credentials',
+                'scope':'https://graph.microsoft.com/.default',
+                'client_id':client_id,
+                'client_secret':client_secret
+            }
+            response = self.session.post(authUrl, data=body)
+            result = response.json()
+            access_token = result['access_token']
+            token_cache.store(cache_key, access_token, result.get('expires_in'))
         return {
             'Authorization':f'Bearer {access_token}'
         }
     
     def update_log(self, **kwargs):
-        kwargs['fileName'] = 'Microsoft Graph API log.xlsx' ##Default
-        kwargs['parentFolderName'] = 'Shared Document/Reporting and Data Management/Connector Log'
-        data = [{
+        record = {
             'execution_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'username':os.getlogin(),
+            'username':getpass.getuser(),
             'function_used':kwargs.get('function_used'),
             'kwargs':str(kwargs.get('kwargs')),
             'response_code':kwargs.get('response_code')
-        }]
-        new_record = pd.DataFrame(data)
-        df = self.read_item(**kwargs)
-        df['execution_at'] = df['execution_at'].dt.strftime('%Y-%m-%d %H:%M:%S')
-        latest_df = pd.concat([df, new_record])
-        return self.update_same_file(latest_df, **kwargs)
-    
+        }
+        self.audit_sink.add(record)
+        return True
+
+    def write_log_records(self, records: list):
+        kwargs = {
+            'fileName': 'Microsoft Graph API log.xlsx', ##Default
+            'parentFolderName': 'Shared Document/Reporting and Data Management/Connector Log',
+        }
+        result = self.update_same_file(pd.DataFrame(records), append=True, use_session=False, **kwargs)
+        if result != 200:
+            raise RuntimeError(f'Failed to write {len(records)} log records: {result}')
+        return result
+
+    def remember_item(self, key, item: dict, **values):
+        """Store what a driveItem response resolves to in the resolution cache and return the cached entry."""
+        parent_path = item.get('parentReference', {}).get('path', '')
+        return self.resolution_cache.update(
+            key,
+            id=item.get('id'),
+            name=item.get('name'),
+            eTag=item.get('eTag'),
+            downloadUrl=item.get('@microsoft.graph.downloadUrl'),
+            path=f"{parent_path.split('root:', 1)[-1].strip('/')}/{item.get('name')}" if 'root:' in parent_path else None,
+            **values
+        )
+
     def check_group(self, **kwargs):
         site_id = self.site_id
         list_id = self.list_id
@@ -81,11 +470,11 @@ class microsoft_sharepoint:
             return False, 'There is no parentFolderID and parentFolderName to search!'
         header = self.get_token(**kwargs)
         if kwargs.get('parentFolderID'):
-            requestURL = f'https://graph.microsoft.com/v1.0/sites/{site_id}/lists/{list_id}/items/{kwargs.get("parentFolderID")}/driveItem/children'
+            requestURL = f'{self.graph_url}/sites/{site_id}/lists/{list_id}/items/{kwargs.get("parentFolderID")}/driveItem/children'
         if kwargs.get('parentFolderName'):
-            requestURL = f'https://graph.microsoft.com/v1.0/sites/{site_id}/drive/root:/{kwargs.get("parentFolderName")}:/children'
+            requestURL = f'{self.graph_url}/sites/{site_id}/drive/root:/{kwargs.get("parentFolderName")}:/children'
         result = []
-        response = requests.get(requestURL, headers=header)
+        response = self.session.get(requestURL, headers=header)
         resultJson = response.json()
         # Determine whether to list only files or only folders
         list_files_only = kwargs.get('files_only', False)
@@ -102,7 +491,7 @@ class microsoft_sharepoint:
                     result.append(item.get('name'))
             if not '@odata.nextLink' in resultJson:
                 break
-            response = requests.get(resultJson['@odata.nextLink'], headers=header)
+            response = self.session.get(resultJson['@odata.nextLink'], headers=header)
             resultJson = response.json()
         log_kwargs = {
             'function_used':inspect.currentframe().f_code.co_name,
@@ -123,28 +512,34 @@ class microsoft_sharepoint:
         parentFolderName = kwargs.get('parentFolderName')
         if kwargs.get('fileURL'):
             parentFolderName, fileName = kwargs.get('fileURL').rsplit('/', 1)
-        fileUrl = f"https://graph.microsoft.com/v1.0/sites/{site_id}/lists/{list_id}/items?$select=lastModifiedDateTime,id,contentType&expand=fields(select=FileLeafRef,id)&filter=fields/FileLeafRef eq '{fileName}'"
+        cache_key = ('path', site_id, f'{parentFolderName}/{fileName}'.strip('/'))
+        cached = self.resolution_cache.get(cache_key) if parentFolderName else None
+        if cached and cached.get('listItemId'):
+            return cached['listItemId']
+        fileUrl = f"{self.graph_url}/sites/{site_id}/lists/{list_id}/items?$select=lastModifiedDateTime,id,contentType&expand=fields(select=FileLeafRef,id)&filter=fields/FileLeafRef eq '{fileName}'"
         header['Prefer']='HonorNonIndexedQueriesWarningMayFailRandomly'
-        response = requests.get(fileUrl, headers=header)
+        response = self.session.get(fileUrl, headers=header)
         result = response.json()
         if result['value'] == []:
             return False, 'There is no file exist!'
         resultID = pd.DataFrame(result['value'])
         if not parentFolderName and len(result['value']) > 1:
             return False, 'There are multiple same name files exist! Please insert the parentFolderName to get the correct file!'
-        crossCheck = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/"
-        checkID = requests.get(crossCheck, headers=header)
-        checkID = re.search(r'\{(.+?)\}', checkID.json().get('eTag')).group(1).lower()
+        crossCheck = f"{self.graph_url}/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/"
+        checkItem = self.session.get(crossCheck, headers=header).json()
+        checkID = re.search(r'\{(.+?)\}', checkItem.get('eTag')).group(1).lower()
         resultID = resultID.loc[resultID['@odata.etag'].str.contains(checkID)]
-        return(resultID['fields'][0].get('id'))
+        listItemId = resultID['fields'].iloc[0].get('id')
+        self.remember_item(cache_key, checkItem, listItemId=listItemId)
+        return listItemId
     
     def search_itemName(self, **kwargs):
         site_id, list_id = self.check_group(**kwargs)
         if not kwargs.get('fileID'):
             return False, 'There is no fileID for searching'
         header = self.get_token()
-        fileUrl = f"https://graph.microsoft.com/v1.0/sites/{site_id}/lists/{list_id}/items/{kwargs.get('fileID')}"
-        response = requests.get(fileUrl, headers=header)
+        fileUrl = f"{self.graph_url}/sites/{site_id}/lists/{list_id}/items/{kwargs.get('fileID')}"
+        response = self.session.get(fileUrl, headers=header)
         result = response.json()
         try:
             filename = result['fields']['FileLeafRef']
@@ -157,28 +552,36 @@ class microsoft_sharepoint:
         header = self.get_token()
         fileName = kwargs.get('fileName')
         parentFolderName = kwargs.get('parentFolderName')
-        crossCheck = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/"
-        response = requests.get(crossCheck, headers=header)
+        crossCheck = f"{self.graph_url}/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/"
+        response = self.session.get(crossCheck, headers=header)
         if response.status_code == 200:
             result = response.json()
             return result['@microsoft.graph.downloadUrl']
 
     def download_item(self, **kwargs):
-        download_url = self.download_url(**kwargs)
         fileName = kwargs.get('fileName')
         if kwargs.get('fileURL'):
             parentFolderName, fileName = kwargs.get('fileURL').rsplit('/', 1)
         if kwargs.get('folderName'):
             fileName = f"{kwargs.get('folderName')}/{fileName}"
-        response = requests.get(download_url, stream=True)
-        if response.status_code == 200:
-            with open(fileName, 'wb') as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    file.write(chunk)
+        if self.download_cache is not None and kwargs.get('use_cache', True):
+            site_id, list_id = self.check_group(**kwargs)
+            item = self.item_metadata(site_id, self.get_token(), kwargs.get('parentFolderName'), kwargs.get('fileName'))
+            if item is not None:
+                shutil.copyfile(self.cached_file(item), fileName)
+            response_code = 200 if item is not None else 404
+        else:
+            download_url = self.download_url(**kwargs)
+            response = self.session.get(download_url, stream=True)
+            if response.status_code == 200:
+                with open(fileName, 'wb') as file:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        file.write(chunk)
+            response_code = response.status_code
         log_kwargs = {
             'function_used':inspect.currentframe().f_code.co_name,
             'kwargs': kwargs,
-            'response_code':response.status_code,
+            'response_code':response_code,
         }
         self.update_log(**log_kwargs)
         return True 
@@ -190,11 +593,16 @@ class microsoft_sharepoint:
             itemID = kwargs.get('fileID')
         else:
             itemID = self.search_itemID(**kwargs)
-        if not itemID[0]:
+        if isinstance(itemID, tuple):
             return itemID
-        requests_url = f"https://graph.microsoft.com/v1.0/sites/{site_id}/lists/{list_id}/items/{itemID}"
+        itemID = str(itemID)
+        requests_url = f"{self.graph_url}/sites/{site_id}/lists/{list_id}/items/{itemID}"
+        # Resolve the drive item first, cached path and share lookups only know it by drive id or path
+        path = f"{kwargs.get('parentFolderName')}/{kwargs.get('fileName')}".strip('/') if kwargs.get('fileName') and kwargs.get('parentFolderName') else None
+        drive_item = self.session.get(f"{requests_url}/driveItem?$select=id", headers=header)
+        drive_item_id = drive_item.json().get('id') if drive_item.status_code == 200 else None
         try:
-            response = requests.delete(requests_url, headers=header)
+            response = self.session.delete(requests_url, headers=header)
             log_kwargs = {
                 'function_used':inspect.currentframe().f_code.co_name,
                 'kwargs': kwargs,
@@ -202,6 +610,7 @@ class microsoft_sharepoint:
             }
             self.update_log(**log_kwargs)
             if response.status_code == 204:
+                self.resolution_cache.invalidate(('path', site_id, path), listItemId=itemID, id=drive_item_id, path=path)
                 return True
         except Exception as e:
             return False, str(e)   
@@ -216,10 +625,16 @@ class microsoft_sharepoint:
         fileLocated = kwargs.get('fileLocated')
         if kwargs.get('fileURL'):
             parentFolderName, fileName = kwargs.get('fileURL').rsplit('/', 1)
-        with open(f'.{fileLocated}/{fileName}', 'rb') as f:
-            data = f.read()
-        requests_url = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/content"
-        response = requests.put(requests_url, headers=header, data=data)
+        local_path = f'.{fileLocated}/{fileName}'
+        file_size = os.path.getsize(local_path)
+        if kwargs.get('large_file', file_size > 4 * 1024 * 1024) and file_size > 0:
+            item_url = f"{self.graph_url}/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:"
+            response = self.upload_large_item(local_path, item_url, header, kwargs.get('chunk_size', 10 * 1024 * 1024), kwargs.get('max_retries', 5))
+        else:
+            with open(local_path, 'rb') as f:
+                data = f.read()
+            requests_url = f"{self.graph_url}/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/content"
+            response = self.session.put(requests_url, headers=header, data=data)
         log_kwargs = {
             'function_used':inspect.currentframe().f_code.co_name,
             'kwargs': kwargs,
@@ -227,16 +642,94 @@ class microsoft_sharepoint:
         }
         self.update_log(**log_kwargs)
         if response.status_code == 201 or response.status_code == 200:
+            path = f'{parentFolderName}/{fileName}'.strip('/')
+            self.resolution_cache.invalidate(('path', site_id, path), path=path)
             return True
         return False
     
+    def upload_large_item(self, local_path: str, item_url: str, header: dict, chunk_size: int = 10 * 1024 * 1024, max_retries: int = 5):
+        """
+        Upload a file through a Graph upload session, streaming fixed-size chunks from disk.
+
+        After a failed or dropped chunk the session is asked for its next expected byte range and the
+        upload resumes from there, so only the unacknowledged bytes are sent again.
+
+        Args:
+            local_path (str): The file to upload.
+            item_url (str): Graph address of the target item, e.g. `.../drive/root:/{parentFolderName}/{fileName}:`.
+            header (dict): Authorization header for creating the session.
+            chunk_size (int, optional): Bytes per chunk, rounded down to a multiple of 320 KiB (default is 10 MiB).
+            max_retries (int, optional): Consecutive failed attempts tolerated per chunk (default is 5).
+
+        Returns:
+            Response: the final response of the upload session.
+        """
+        unit = 320 * 1024
+        chunk_size = max(unit, chunk_size // unit * unit)
+        session_url = f"{item_url}/createUploadSession"
+        body = {'item': {'@microsoft.graph.conflictBehavior': 'replace'}}
+        response = self.session.post(session_url, headers={**header, 'Content-Type': 'application/json'}, data=json.dumps(body))
+        if response.status_code != 200:
+            return response
+        upload_url = response.json()['uploadUrl']
+        file_size = os.path.getsize(local_path)
+        offset = 0
+        retries = 0
+        with open(local_path, 'rb') as f:
+            while True:
+                f.seek(offset)
+                chunk = f.read(min(chunk_size, file_size - offset))
+                # The upload url is pre-authenticated, so no Authorization header is sent with the chunks
+                chunk_header = {
+                    'Content-Length': str(len(chunk)),
+                    'Content-Range': f'bytes {offset}-{offset + len(chunk) - 1}/{file_size}'
+                }
+                try:
+                    response = self.session.put(upload_url, headers=chunk_header, data=chunk)
+                    if response.status_code in (200, 201):
+                        return response
+                    if response.status_code == 202:
+                        offset = int(response.json()['nextExpectedRanges'][0].split('-')[0])
+                        retries = 0
+                        continue
+                except requests.RequestException:
+                    if retries >= max_retries:
+                        raise
+                if retries >= max_retries:
+                    return response
+                retries += 1
+                time.sleep(min(2 ** retries, 30))
+                status = self.session.get(upload_url)
+                if status.status_code != 200:
+                    return status
+                offset = int(status.json()['nextExpectedRanges'][0].split('-')[0])
+
+    def upload_items(self, items: list, max_workers: int = 4):
+        """
+        Upload several files in parallel.
+
+        Args:
+            items (list): One dict of `upload_item` keyword arguments per file.
+            max_workers (int, optional): Files uploaded at the same time (default is 4).
+
+        Returns:
+            list: `upload_item` result per file, in the order of `items`.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda item: self.upload_item(**item), items))
+
     def update_same_file(self, df = pd.DataFrame(), **kwargs):
         """
         group: str [Default: P-Data Management DP],
         df: dataframe [Default: empty],
         fileName: str [Default: empty],
         parentFolderName: str [Default: empty],
-        fileURL: str [Default: empty]
+        fileURL: str [Default: empty],
+        sheet_name: str [Default: Sheet1],
+        append: bool [Default: False] write below the used range instead of replacing from row 2,
+        block_rows: int [Default: 2000] rows per PATCH request,
+        max_workers: int [Default: 4] row blocks written at the same time,
+        use_session: bool [Default: True] keep one workbook session open for all requests
         """
         site_id, list_id = self.check_group(**kwargs)
         header = self.get_token()
@@ -244,21 +737,58 @@ class microsoft_sharepoint:
             return 'Missing Dataframe!'
         if not kwargs.get('fileName') and not kwargs.get('parentFolderName') and not kwargs.get('fileURL'):
             return False, 'There is no fileName, parentFolderName or fileURL to search!'
-        data = df.values.tolist()
+        data = df.astype(object).where(df.notna(), None).values.tolist()
         num_rows = len(data)
-        num_columns = len(df.columns)
-        end_column_letter = chr(ord('A') + num_columns - 1)
-        range_address = f"A2:{end_column_letter}{num_rows + 1}"
-        update_url = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drive/root:/{kwargs.get('parentFolderName')}/{kwargs.get('fileName')}:/workbook/worksheets('Sheet1')/range(address='{range_address}')"
-        clear_url = update_url+"/clear"
-        clear_response = requests.post(clear_url, headers=header)
-        if clear_response.status_code != 204: 
-            return False, f"Failed to clear the existing content. Status code: {clear_response.status_code}, Message: {clear_response.text}"
-        body = {
-            "values": data
-        }
-        update_response = requests.patch(update_url, headers={**header, "Content-Type": "application/json"}, data=json.dumps(body))
-        return update_response.status_code
+        end_column_letter = column_letter(len(df.columns))
+        workbook_url = f"{self.graph_url}/sites/{site_id}/drive/root:/{kwargs.get('parentFolderName')}/{kwargs.get('fileName')}:/workbook"
+        worksheet_url = f"{workbook_url}/worksheets('{kwargs.get('sheet_name', 'Sheet1')}')"
+        session_id = self.workbook_session(workbook_url, header) if kwargs.get('use_session', True) else None
+        if session_id:
+            header['workbook-session-id'] = session_id
+        try:
+            if kwargs.get('append', False):
+                used_range = self.session.get(f"{worksheet_url}/usedRange(valuesOnly=true)?$select=address", headers=header)
+                if used_range.status_code != 200:
+                    return False, f"Failed to read the used range. Status code: {used_range.status_code}, Message: {used_range.text}"
+                start_row = int(re.search(r'(\d+)$', used_range.json().get('address')).group(1)) + 1
+            else:
+                start_row = 2
+                clear_url = f"{worksheet_url}/range(address='A2:{end_column_letter}{num_rows + 1}')/clear"
+                clear_response = self.session.post(clear_url, headers=header)
+                if clear_response.status_code != 204: 
+                    return False, f"Failed to clear the existing content. Status code: {clear_response.status_code}, Message: {clear_response.text}"
+            block_rows = kwargs.get('block_rows', 2000)
+
+            def write_block(offset):
+                block = data[offset:offset + block_rows]
+                range_address = f"A{start_row + offset}:{end_column_letter}{start_row + offset + len(block) - 1}"
+                update_url = f"{worksheet_url}/range(address='{range_address}')"
+                body = {
+                    "values": block
+                }
+                update_response = self.session.patch(update_url, headers={**header, "Content-Type": "application/json"}, data=json.dumps(body, default=str))
+                return update_response.status_code
+
+            with ThreadPoolExecutor(max_workers=kwargs.get('max_workers', 4)) as executor:
+                status_codes = list(executor.map(write_block, range(0, num_rows, block_rows)))
+            return next((code for code in status_codes if code != 200), 200)
+        finally:
+            if session_id:
+                self.session.post(f"{workbook_url}/closeSession", headers=header)
+
+    def workbook_session(self, workbook_url: str, header: dict):
+        """
+        Open a persistent workbook session so Excel Online keeps the file loaded between requests.
+        Returns the session id, or None if the session could not be created.
+        """
+        response = self.session.post(
+            f"{workbook_url}/createSession",
+            headers={**header, "Content-Type": "application/json"},
+            data=json.dumps({"persistChanges": True})
+        )
+        if response.status_code != 201:
+            return None
+        return response.json().get('id')
     
     def read_item(self, **kwargs):
         site_id, list_id = self.check_group(**kwargs)
@@ -269,133 +799,335 @@ class microsoft_sharepoint:
         parentFolderName = kwargs.get('parentFolderName')
         if kwargs.get('fileURL'):
             parentFolderName, fileName = kwargs.get('fileURL').rsplit('/', 1)
-        requests_url = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/content"
-        response = requests.get(requests_url, headers=header)
+        if self.download_cache is not None and kwargs.get('use_cache', True):
+            item = self.item_metadata(site_id, header, parentFolderName, fileName)
+            if item is None:
+                return False, 'There is no file exist!'
+            return self.read_cached(item, **kwargs)
+        requests_url = f"{self.graph_url}/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/content"
+        response = self.session.get(requests_url, headers=header)
+        if response.status_code != 200:
+            return False, f"Error fetching file: {response.status_code} - {response.text}"
         file_content = BytesIO(response.content)
-        if fileName.split(".")[-1] == 'csv':   
-            return pd.read_csv(file_content)
-        elif fileName.split(".")[-1] == 'py':
+        return self.parse_content(file_content, fileName, **kwargs)
+
+    def parse_content(self, file_content, file_name: str, **kwargs):
+        """
+        Parse a downloaded file based on its extension into a Pandas DataFrame, or with `df_type`
+        'pl' / 'arrow' into a Polars DataFrame / pyarrow Table.
+
+        csv, txt, zipped csv and parquet are decoded natively by Polars or pyarrow, other formats are
+        read with Pandas and converted.
+        """
+        file_extension = file_name.split('.')[-1].lower()
+        df_type = kwargs.get('df_type', 'pd')
+        if df_type != 'pd' and file_extension in ('csv', 'txt', 'zip', 'parquet'):
+            if file_extension == 'parquet':
+                return self.read_parquet(file_content, df_type)
+            if file_extension == 'zip':
+                with zipfile.ZipFile(file_content, 'r') as z:
+                    file_content = BytesIO(z.read(z.namelist()[0]))
+            separator, skip_rows = ',', 0
+            if file_extension == 'txt':
+                separator, skip_rows = kwargs.get('separator',';'), kwargs.get('skip_row',1)
+            if df_type == 'pl':
+                return pl.read_csv(file_content, separator=separator, skip_rows=skip_rows)
+            return pa_csv.read_csv(
+                file_content,
+                read_options=pa_csv.ReadOptions(skip_rows=skip_rows),
+                parse_options=pa_csv.ParseOptions(delimiter=separator)
+            )
+        if file_extension == 'csv':   
+            df = pd.read_csv(file_content)
+        elif file_extension == 'py':
             return self.download_item(**kwargs)
-        elif fileName.split(".")[-1] == 'xlsb':
-            return pd.read_excel(file_content, sheet_name=kwargs.get('sheet_name','Sheet1'), engine='pyxlsb')
-        elif fileName.split(".")[-1] == 'xlsx':
-            return pd.read_excel(file_content, sheet_name=kwargs.get('sheet_name','Sheet1'), engine='openpyxl')
-        elif fileName.split(".")[-1] == 'parquet':
-            return pd.read_parquet(file_content)
-        elif fileName.split(".")[-1] == 'zip':
+        elif file_extension == 'xlsb':
+            df = pd.read_excel(file_content, sheet_name=kwargs.get('sheet_name','Sheet1'), engine='pyxlsb')
+        elif file_extension == 'xlsx':
+            df = pd.read_excel(file_content, sheet_name=kwargs.get('sheet_name','Sheet1'), engine='openpyxl')
+        elif file_extension == 'parquet':
+            df = pd.read_parquet(file_content)
+        elif file_extension == 'zip':
             with zipfile.ZipFile(file_content, 'r') as z:
                 with z.open(z.namelist()[0]) as f:
-                    return pd.read_csv(f)
-        elif fileName.split(".")[-1] == 'txt':
+                    df = pd.read_csv(f)
+        elif file_extension == 'txt':
             file_content.seek(0) 
-            return pd.read_csv(file_content, sep=kwargs.get('separator',';'), skiprows=kwargs.get('skip_row',1))
-        return pd.read_excel(file_content, sheet_name=kwargs.get('sheet_name','Sheet1'))
+            df = pd.read_csv(file_content, sep=kwargs.get('separator',';'), skiprows=kwargs.get('skip_row',1))
+        else:
+            df = pd.read_excel(file_content, sheet_name=kwargs.get('sheet_name','Sheet1'))
+        if df_type == 'pl':
+            return pl.from_pandas(df)
+        if df_type == 'arrow':
+            return pa.Table.from_pandas(df, preserve_index=False)
+        return df
+
+    def read_parquet(self, source, df_type: str = 'pd'):
+        if df_type == 'pl':
+            return pl.read_parquet(source)
+        if df_type == 'arrow':
+            return pq.read_table(source)
+        return pd.read_parquet(source)
+
+    def write_parquet(self, df, path: str):
+        if isinstance(df, pl.DataFrame):
+            df.write_parquet(path)
+        elif isinstance(df, pa.Table):
+            pq.write_table(df, path)
+        else:
+            df.to_parquet(path, index=False)
+
+    def item_metadata(self, site_id: str, header: dict, parentFolderName: str = None, fileName: str = None, fileURL: str = None):
+        """
+        Metadata-only lookup of a drive item by path or shared url. Returns None if the item cannot be fetched.
+        """
+        requests_url = f"{self.graph_url}/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:"
+        if fileURL:
+            encoded_shared_url = (
+                base64.urlsafe_b64encode(fileURL.encode("utf-8"))
+                .decode("utf-8")
+                .rstrip("=")
+            )
+            requests_url = f"{self.graph_url}/shares/u!{encoded_shared_url}/driveItem"
+        response = self.session.get(requests_url, headers=header)
+        if response.status_code != 200:
+            return None
+        return response.json()
+
+    def cached_file(self, item: dict):
+        """
+        Return the local cached path of a drive item, downloading it only if its cTag changed.
+        """
+        cTag = item.get('cTag') or item.get('eTag')
+        path = self.download_cache.get(item['id'], cTag)
+        if path is not None:
+            return path
+
+        def write(temp_path):
+            with self.session.get(item['@microsoft.graph.downloadUrl'], stream=True) as response:
+                response.raise_for_status()
+                with open(temp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        f.write(chunk)
+        return self.download_cache.put(item['id'], cTag, write)
+
+    def read_cached(self, item: dict, **kwargs):
+        """
+        Parse a drive item from the download cache. With `cache_parsed=True` the parsed DataFrame is also
+        cached as parquet, so unchanged files skip both the download and the parse.
+        """
+        cTag = item.get('cTag') or item.get('eTag')
+        df_type = kwargs.get('df_type', 'pd')
+        options = json.dumps([kwargs.get('sheet_name','Sheet1'), kwargs.get('separator',';'), kwargs.get('skip_row',1), df_type])
+        suffix = f".{hashlib.md5(options.encode('utf-8')).hexdigest()[:12]}.parquet"
+        if kwargs.get('cache_parsed', False):
+            parsed_path = self.download_cache.get(item['id'], cTag, suffix)
+            if parsed_path is not None:
+                return self.read_parquet(parsed_path, df_type)
+        with open(self.cached_file(item), 'rb') as file_content:
+            df = self.parse_content(file_content, item['name'], **kwargs)
+        if kwargs.get('cache_parsed', False) and isinstance(df, (pd.DataFrame, pl.DataFrame, pa.Table)):
+            try:
+                self.download_cache.put(item['id'], cTag, lambda path: self.write_parquet(df, path), suffix)
+            except (pa.ArrowException, ValueError):
+                # Mixed-type columns cannot be stored as parquet, keep the raw file only
+                pass
+        return df
     
     def show_all_sharepoint_list(self, **kwargs):
         site_id, list_id = self.check_group(**kwargs)
         header = self.get_token()
-        requests_url = f"https://graph.microsoft.com/v1.0/sites/{site_id}/lists"
-        response = requests.get(requests_url, headers=header).json()
+        requests_url = f"{self.graph_url}/sites/{site_id}/lists"
+        response = self.session.get(requests_url, headers=header).json()
         if response.get('value',False):
             result = pd.DataFrame(response.get('value'))
             return result[['name','id','displayName']]
         return pd.DataFrame()
     
     def read_sharepoint_list(self, **kwargs):
+        """
+        Read all items of a SharePoint list, following every page.
+
+        Args:
+            kwargs:
+                - group (str, optional): The group channel name (default is P-Data Management DP).
+                - listName (str): The display name of the list.
+                - columns (list, optional): Only return these fields (default is all fields).
+                - filter (str, optional): Server-side OData filter on indexed columns, e.g. "fields/Status eq 'Open'".
+                - top (int, optional): Items per page (default is 5000).
+                - df_type (str, optional): 'pd' for Pandas or 'pl' for Polars (default is 'pd').
+
+        Returns:
+            DataFrame: one row per list item with its fields as columns.
+        """
         site_id, list_id = self.check_group(**kwargs)
-        df = self.show_all_sharepoint_list(**kwargs)
         if not kwargs.get('listName',False):
             return "No Specific listName!"
-        listId = df.loc[df['displayName']==kwargs.get('listName')]['id']
-        if len(listId.values) == 0:
-            return "listName not exists!"
-        listId = listId.values[0]
+        cache_key = ('list', site_id, kwargs.get('listName'))
+        cached = self.resolution_cache.get(cache_key)
+        if cached is None:
+            df = self.show_all_sharepoint_list(**kwargs)
+            listId = df.loc[df['displayName']==kwargs.get('listName')]['id'] if not df.empty else df
+            if len(listId.values) == 0:
+                return "listName not exists!"
+            cached = self.resolution_cache.update(cache_key, listId=listId.values[0])
+        listId = cached['listId']
         header = self.get_token()
-        requests_url = f"https://graph.microsoft.com/v1.0/sites/{site_id}/lists/{listId}/items?expand=fields"
-        response = requests.get(requests_url, headers=header).json()
-        if response.get('value',False):
-            result = pd.DataFrame(response.get('value'))
-            final_df = result['fields'].apply(pd.Series)
-            return final_df
-        return pd.DataFrame()
+        expand = f"fields(select={','.join(kwargs.get('columns'))})" if kwargs.get('columns') else 'fields'
+        requests_url = f"{self.graph_url}/sites/{site_id}/lists/{listId}/items?$select=id&$expand={expand}&$top={kwargs.get('top', 5000)}"
+        if kwargs.get('filter'):
+            requests_url += f"&$filter={kwargs.get('filter')}"
+        items, status_code = self.list_children(requests_url, header)
+        records = [item.get('fields', {}) for item in items]
+        if kwargs.get('df_type', 'pd') == 'pl':
+            return pl.from_dicts(records, infer_schema_length=None) if records else pl.DataFrame()
+        return pd.DataFrame.from_records(records)
     
     def get_group_details(self):
         header = self.get_token()
-        requests_url = f"https://graph.microsoft.com/v1.0/groups?$filter=mailEnabled eq false&securityEnabled eq true"
+        requests_url = f"{self.graph_url}/groups?$filter=mailEnabled eq false&securityEnabled eq true"
         result = []
-        response = requests.get(requests_url, headers=header)
+        response = self.session.get(requests_url, headers=header)
         resultJson = response.json()
         while True:
             if resultJson.get('value') != []:
                 result += resultJson.get('value')
             if not '@odata.nextLink' in resultJson:
                 break
-            response = requests.get(resultJson['@odata.nextLink'], headers=header)
+            response = self.session.get(resultJson['@odata.nextLink'], headers=header)
             resultJson = response.json()
         if result != []:
             return pd.DataFrame(result)
         return result
     
+    def group_id(self, groupName: str, force_refresh: bool = False):
+        """
+        Resolve a security group displayName to its id from the directory cache.
+
+        A stale cache is refreshed with the groups delta query, so only groups changed since the
+        previous refresh are transferred. A failed refresh raises `requests.HTTPError` and leaves the
+        cache stale.
+        """
+        with self.directory.lock:
+            if force_refresh or self.directory.groups_stale():
+                header = self.get_token()
+                requestURL = self.directory.groups_delta_link or f"{self.graph_url}/groups/delta?$select=id,displayName,mailEnabled,securityEnabled"
+                changes = []
+                while True:
+                    response = self.session.get(requestURL, headers=header)
+                    if response.status_code == 410 and self.directory.groups_delta_link:
+                        # Delta link expired, start a full enumeration again
+                        self.directory.groups, self.directory.groups_delta_link, changes = {}, None, []
+                        requestURL = f"{self.graph_url}/groups/delta?$select=id,displayName,mailEnabled,securityEnabled"
+                        continue
+                    # A failed page is not an empty change set: keep the index stale so the next call retries
+                    response.raise_for_status()
+                    resultJson = response.json()
+                    changes += resultJson.get('value', [])
+                    if '@odata.nextLink' not in resultJson:
+                        break
+                    requestURL = resultJson['@odata.nextLink']
+                self.directory.apply_group_changes(changes)
+                self.directory.groups_delta_link = resultJson.get('@odata.deltaLink')
+            return self.directory.group_ids.get(groupName)
+
+    def staff_object_ids(self, email: list, force_refresh: bool = False):
+        """
+        Map emails to object ids from 'All Staff.csv', cached for `directory_ttl` seconds.
+
+        Returns:
+            dict: object_id -> email for the emails found.
+        """
+        with self.directory.lock:
+            if force_refresh or self.directory.staff_stale():
+                userDf = self.read_item(**{'fileURL':'Shared Document/All Employee/All Staff.csv'})
+                self.directory.set_staff(userDf)
+            staff_ids = self.directory.staff_ids
+        return {staff_ids[text.lower()]: text.lower() for text in email if text.lower() in staff_ids}
+
     def get_groupmember_details(self, **kwargs):
+        """
+        Members of one or more security groups, fetched concurrently.
+
+        Args:
+            kwargs:
+                - group_name (str or list): The group display name(s).
+                - select (list, optional): Only request these member fields, e.g. ['id', 'mail'] (default is every
+                  field Graph returns for members, as before).
+                - max_workers (int, optional): Groups fetched at the same time (default is 8).
+
+        Returns:
+            DataFrame: one row per member and group, with the member fields, '@odata.type' and groupName.
+        """
         header = self.get_token()
-        groupDf = self.get_group_details()
         groupName = kwargs.get('group_name',False)
         if not groupName:
             return pd.DataFrame()
         if type(kwargs.get('group_name')) != list:
             groupName = [groupName]
-        groupDf = groupDf[groupDf['displayName'].isin(groupName)]
-        finalDf = []
-        if not groupDf.empty:
-            groupIds = list(set(groupDf['id']))
-            for groupId in groupIds:
-                result = []
-                requests_url = f"https://graph.microsoft.com/v1.0/groups/{groupId}/members"
-                response = requests.get(requests_url, headers=header)
-                resultJson = response.json()
-                if resultJson.get('value') != []:
-                    result += resultJson.get('value')
-                while '@odata.nextLink' in resultJson:
-                    response = requests.get(resultJson['@odata.nextLink'], headers=header)
-                    resultJson = response.json()
-                    result += resultJson.get('value')
-                groupResult = pd.DataFrame(result)
-                groupResult['groupName'] = groupDf[groupDf['id']==groupId]['displayName'].values[0]
-                finalDf.append(groupResult)
-            finalResult = pd.concat(finalDf)
-            if not finalResult.empty:
-                return finalResult
+        groupNames = {self.group_id(name): name for name in groupName}
+        groupNames.pop(None, None)
+        if not groupNames:
+            return pd.DataFrame()
+        select = kwargs.get('select')
+        projection = f"$select={','.join(select)}&" if select else ''
+
+        def fetch_members(groupId):
+            requests_url = f"{self.graph_url}/groups/{groupId}/members?{projection}$top=999"
+            members, status_code = self.list_children(requests_url, header)
+            return groupId, members
+
+        with ThreadPoolExecutor(max_workers=kwargs.get('max_workers', 8)) as executor:
+            results = list(executor.map(fetch_members, groupNames))
+        # Collect every group into one set of columns and build a single DataFrame at the end
+        if select:
+            fields = ['@odata.type', *select]
+        else:
+            fields = list(dict.fromkeys(column for groupId, members in results for member in members for column in member))
+        columns = {column: [] for column in [*fields, 'groupName']}
+        for groupId, members in results:
+            for member in members:
+                for column in fields:
+                    columns[column].append(member.get(column))
+            columns['groupName'] += [groupNames[groupId]] * len(members)
+        finalResult = pd.DataFrame(columns)
+        if not finalResult.empty:
+            return finalResult
         return pd.DataFrame()
     
     def add_member_into_group(self, **kwargs):
         header = self.get_token()
         header['Content-Type'] = 'application/json'
-        groupDf = self.get_group_details()
         groupName = kwargs.get('group_name',False)
         if not groupName:
             return 'No Group Name Provided!'
-        groupDf = groupDf[groupDf['displayName']==groupName]
-        if groupDf.empty:
+        groupId = self.group_id(groupName)
+        if groupId is None:
             return 'No Specific Group!'
-        groupId = groupDf['id'].values[0]
         email = kwargs.get('email', False)
         if not email:
             return 'No Email Provided!'
         if type(email) != list:
             email = [email]
-        email = [text.lower() for text in email]
-        requests_url = f"https://graph.microsoft.com/v1.0/groups/{groupId}/members/$ref"
-        userDf = self.read_item(**{'fileURL':'Shared Document/All Employee/All Staff.csv'})
-        userDf['email'] = userDf['email'].str.lower()
-        resultDf = userDf.loc[userDf['email'].isin(email)]
-        if resultDf.empty:
+        requests_url = f"{self.graph_url}/groups/{groupId}/members/$ref"
+        users = self.staff_object_ids(email)
+        if not users:
             return False, 'User not found!'
-        users_id = list(set(resultDf['object_id'])) 
+        users_id = list(users)
+        if kwargs.get('bulk', False):
+            batch_requests = [{
+                'id': str(user),
+                'method': 'POST',
+                'url': f'/groups/{groupId}/members/$ref',
+                'headers': {'Content-Type': 'application/json'},
+                'body': {"@odata.id": f"https://graph.microsoft.com/v1.0/directoryObjects/{user}"}
+            } for user in users_id]
+            return self.batch_group_membership(batch_requests, users, inspect.currentframe().f_code.co_name, **kwargs)
         for user in users_id:
             payload = json.dumps({
                 "@odata.id": f"https://graph.microsoft.com/v1.0/directoryObjects/{user}"
             })
-            response = requests.request("POST", requests_url, headers=header, data=payload)
+            response = self.session.request("POST", requests_url, headers=header, data=payload)
         log_kwargs = {
             'function_used':inspect.currentframe().f_code.co_name,
             'kwargs': kwargs,
@@ -406,30 +1138,32 @@ class microsoft_sharepoint:
     
     def remove_member_from_group(self, **kwargs):
         header = self.get_token()
-        groupDf = self.get_group_details()
         groupName = kwargs.get('group_name',False)
         if not groupName:
             return 'No Group Name Provided!'
-        groupDf = groupDf[groupDf['displayName']==groupName]
-        if groupDf.empty:
+        groupId = self.group_id(groupName)
+        if groupId is None:
             return 'No Specific Group!'
-        groupId = groupDf['id'].values[0]
         email = kwargs.get('email',False)
         if not email:
             return 'No Email Provided!'
         if type(email) != list:
             email = [email]
-        email = [text.lower() for text in email]
-        userDf = self.read_item(**{'fileURL':'Shared Document/All Employee/All Staff.csv'})
-        userDf['email'] = userDf['email'].str.lower()
-        resultDf = userDf.loc[userDf['email'].isin(email)]
-        if resultDf.empty:
+        users = self.staff_object_ids(email)
+        if not users:
             return False, 'User not found!'
-        users_id = list(set(resultDf['object_id'])) 
+        users_id = list(users)
+        if kwargs.get('bulk', False):
+            batch_requests = [{
+                'id': str(user),
+                'method': 'DELETE',
+                'url': f'/groups/{groupId}/members/{user}/$ref'
+            } for user in users_id]
+            return self.batch_group_membership(batch_requests, users, inspect.currentframe().f_code.co_name, **kwargs)
         for user in users_id:
-            requests_url = f"https://graph.microsoft.com/v1.0/groups/{groupId}/members/{user}/$ref"
+            requests_url = f"{self.graph_url}/groups/{groupId}/members/{user}/$ref"
             payload = {}
-            response = requests.request("DELETE", requests_url, headers=header, data=payload)
+            response = self.session.request("DELETE", requests_url, headers=header, data=payload)
         log_kwargs = {
             'function_used':inspect.currentframe().f_code.co_name,
             'kwargs': kwargs,
@@ -438,10 +1172,65 @@ class microsoft_sharepoint:
         self.update_log(**log_kwargs)
         return response.status_code
 
+    def graph_batch(self, batch_requests: list, max_retries: int = 3, **kwargs):
+        """
+        Send Graph sub-requests through the JSON $batch endpoint, 20 sub-requests per call.
+
+        Sub-requests answered with 429 or a 5xx status are retried up to `max_retries` times,
+        waiting for the largest Retry-After returned. Any other status is final.
+
+        Args:
+            batch_requests (list): Sub-requests with a unique string 'id', 'method', 'url' relative to /v1.0
+                and optional 'headers' and 'body'.
+            max_retries (int, optional): Retry rounds for throttled or failed sub-requests (default is 3).
+
+        Returns:
+            dict: sub-request id -> sub-response with 'status', 'headers' and 'body'.
+        """
+        header = self.get_token(**kwargs)
+        header['Content-Type'] = 'application/json'
+        pending = list(batch_requests)
+        results = {}
+        for attempt in range(max_retries + 1):
+            retry = []
+            retry_after = 1
+            for start in range(0, len(pending), 20):
+                chunk = pending[start:start + 20]
+                response = self.session.post(f'{self.graph_url}/$batch', headers=header, data=json.dumps({'requests': chunk}))
+                if response.status_code == 200:
+                    sub_responses = response.json().get('responses', [])
+                else:
+                    sub_responses = [{'id': request['id'], 'status': response.status_code, 'headers': response.headers, 'body': response.text} for request in chunk]
+                requests_by_id = {request['id']: request for request in chunk}
+                for sub_response in sub_responses:
+                    results[sub_response['id']] = sub_response
+                    if sub_response['status'] == 429 or sub_response['status'] >= 500:
+                        retry.append(requests_by_id[sub_response['id']])
+                        retry_after = max(retry_after, int((sub_response.get('headers') or {}).get('Retry-After', 1)))
+            if not retry or attempt == max_retries:
+                break
+            time.sleep(retry_after)
+            pending = retry
+        return results
+
+    def batch_group_membership(self, batch_requests: list, users: dict, function_used: str, **kwargs):
+        """
+        Run membership sub-requests (id = user object id) via `graph_batch` and report the status per email.
+        """
+        responses = self.graph_batch(batch_requests, max_retries=kwargs.get('max_retries', 3))
+        result = {users[request['id']]: responses[request['id']]['status'] for request in batch_requests}
+        log_kwargs = {
+            'function_used':function_used,
+            'kwargs': kwargs,
+            'response_code':str(result),
+        }
+        self.update_log(**log_kwargs)
+        return result
+
     def get_general_details_by_id(self, sharepoint_id: int):
         header = self.get_token()
         requests_url = f"{self.base_url}/{self.site_id}/lists/{self.list_id}/items/{sharepoint_id}/driveItem"
-        response = requests.get(requests_url, headers=header)
+        response = self.session.get(requests_url, headers=header)
         response_json = response.json()
         response_json["file_path"] = (
             f'{response_json["parentReference"]["path"].split("root:/")[1]}/{response_json["name"]}'
@@ -459,7 +1248,7 @@ class microsoft_sharepoint:
         else:
             raise ValueError("Neither Folder ID or Folder Path Passed In!")
         result = []
-        response = requests.get(request_url, headers=header)
+        response = self.session.get(request_url, headers=header)
         response_json = response.json()
         if response_json.get("value"):
             result = response_json.get("value")
@@ -472,11 +1261,11 @@ class microsoft_sharepoint:
             return False, 'There is no parentFolderID and parentFolderName to search!'
         header = self.get_token()
         if kwargs.get('parentFolderID'):
-            requestURL = f'https://graph.microsoft.com/v1.0/sites/{site_id}/lists/{list_id}/items/{kwargs.get("parentFolderID")}/driveItem/children'
+            requestURL = f'{self.graph_url}/sites/{site_id}/lists/{list_id}/items/{kwargs.get("parentFolderID")}/driveItem/children'
         if kwargs.get('parentFolderName'):
-            requestURL = f'https://graph.microsoft.com/v1.0/sites/{site_id}/drive/root:/{kwargs.get("parentFolderName")}:/children'
+            requestURL = f'{self.graph_url}/sites/{site_id}/drive/root:/{kwargs.get("parentFolderName")}:/children'
         result = []
-        response = requests.get(requestURL, headers=header)
+        response = self.session.get(requestURL, headers=header)
         resultJson = response.json()
         return resultJson
     
@@ -492,22 +1281,191 @@ class microsoft_sharepoint:
 
         main_path = sharepoint_folder_path or self.get_general_details_by_id(sharepoint_folder_id)['file_path']
 
-        # Process files in the current folder
-        all_files = self.list_files(parentFolderName=main_path, files_only=True)
-        file_path_list.extend(f"{main_path}/{file_name}" for file_name in all_files)
+        # layer 1 is the current folder only, each extra layer goes one subfolder level deeper
+        paths = [item['path'] for item in self.crawl_folder(main_path, max_depth=layer - 1)]
 
-        # Stop recursion if layer limit is reached
-        if layer == 1:
-            return file_path_list
+        def tree_order(path):
+            # Crawl results arrive as folders finish; put them back in walk order,
+            # each folder's files first and then its subfolders, by name
+            *folders, file_name = path[len(main_path):].strip('/').split('/')
+            return [(1, folder) for folder in folders] + [(0, file_name)]
 
-        # Process subfolders if deeper layers are needed
-        folder_list = self.list_files(parentFolderName=main_path, folders_only=True)
-        for subfolder in folder_list:
-            subfolder_path = f"{main_path}/{subfolder}"
-            self.get_file_path( sharepoint_folder_id, subfolder_path, file_path_list, layer - 1)
-    
+        file_path_list.extend(sorted(paths, key=tree_order))
         return file_path_list
 
+    def list_children(self, requestURL: str, header: dict):
+        """Return every child item behind `requestURL`, following @odata.nextLink, and the last status code."""
+        result = []
+        while requestURL:
+            response = self.session.get(requestURL, headers=header)
+            resultJson = response.json()
+            result += resultJson.get('value', [])
+            requestURL = resultJson.get('@odata.nextLink')
+        return result, response.status_code
+
+    def crawl_folder(self, folder_path: str, max_depth: int = None, max_workers: int = 8, **kwargs):
+        """
+        Walk a folder tree, listing every folder once and fanning out over subfolders concurrently.
+
+        Args:
+            folder_path (str): The folder to start from, relative to the drive root.
+            max_depth (int, optional): Subfolder levels to descend, 0 lists `folder_path` only (default is unlimited).
+            max_workers (int, optional): Folders listed at the same time (default is 8).
+            kwargs:
+                - group (str, optional): The group channel name (default is P-Data Management DP).
+
+        Yields:
+            dict: path, id, size, eTag and lastModifiedDateTime of each file, as soon as its folder is listed.
+        """
+        site_id, list_id = self.check_group(**kwargs)
+        select = 'id,name,size,eTag,lastModifiedDateTime,folder,file'
+        status_codes = set()
+
+        def list_folder(path):
+            header = self.get_token(**kwargs)
+            requestURL = f'{self.graph_url}/sites/{site_id}/drive/root:/{path}:/children?$select={select}'
+            items, status_code = self.list_children(requestURL, header)
+            status_codes.add(status_code)
+            return path, items
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            pending = {executor.submit(list_folder, folder_path): 0}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    depth = pending.pop(future)
+                    path, items = future.result()
+                    for item in items:
+                        item_path = f"{path}/{item.get('name')}"
+                        if 'folder' in item:
+                            if max_depth is None or depth < max_depth:
+                                pending[executor.submit(list_folder, item_path)] = depth + 1
+                            continue
+                        yield {
+                            'path': item_path,
+                            'id': item.get('id'),
+                            'size': item.get('size'),
+                            'eTag': item.get('eTag'),
+                            'lastModifiedDateTime': item.get('lastModifiedDateTime'),
+                        }
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        log_kwargs = {
+            'function_used':inspect.currentframe().f_code.co_name,
+            'kwargs': {'folder_path': folder_path, 'max_depth': max_depth, **kwargs},
+            'response_code':max(status_codes, default=None),
+        }
+        self.update_log(**log_kwargs)
+
+    def sync_folder_delta(self, folder_path: str = None, state_file: str = '.sharepoint_delta.json', **kwargs):
+        """
+        Return the files added, modified or deleted under a folder since the previous call.
+
+        SharePoint only supports delta queries on the drive root, so the drive is tracked and changes are
+        filtered by path. `state_file` keeps one delta link and item map per site's drive, shared by every
+        watched folder, plus per folder only the files it last reported. The first call for a folder reports
+        every file in it as added; after an expired delta link the drive is enumerated again and diffed.
+
+        Args:
+            folder_path (str, optional): The folder to watch, relative to the drive root (default is the whole drive).
+            state_file (str, optional): JSON file holding the delta state (default is '.sharepoint_delta.json').
+            kwargs:
+                - group (str, optional): The group channel name (default is P-Data Management DP).
+
+        Returns:
+            dict: 'added', 'modified' and 'deleted' lists of files with path, id, size, eTag and lastModifiedDateTime.
+        """
+        site_id, list_id = self.check_group(**kwargs)
+        folder_path = (folder_path or '').strip('/')
+        state = {}
+        if os.path.exists(state_file):
+            with open(state_file, 'r', encoding='utf-8') as f:
+                # Entries without 'folders' are from the older per-folder layout and are rebuilt
+                state = {key: value for key, value in json.load(f).items() if 'folders' in value}
+        drive_state = state.get(site_id, {'folders': {}})
+        items = dict(drive_state.get('items', {}))
+        header = self.get_token(**kwargs)
+        initialURL = f'{self.graph_url}/sites/{site_id}/drive/root/delta?$select=id,name,size,eTag,lastModifiedDateTime,parentReference,file,folder,root,deleted'
+        requestURL = drive_state.get('deltaLink') or initialURL
+        while True:
+            response = self.session.get(requestURL, headers=header)
+            if response.status_code == 410 and requestURL != initialURL:
+                # Delta link expired, enumerate the drive again and diff against the stored items
+                requestURL, items = initialURL, {}
+                continue
+            if response.status_code != 200:
+                return False, f"Error fetching delta: {response.status_code} - {response.text}"
+            resultJson = response.json()
+            for item in resultJson.get('value', []):
+                if 'deleted' in item:
+                    items.pop(item['id'], None)
+                    continue
+                items[item['id']] = {
+                    'name': item.get('name'),
+                    'parentId': item.get('parentReference', {}).get('id'),
+                    'root': 'root' in item,
+                    'folder': 'folder' in item,
+                    'size': item.get('size'),
+                    'eTag': item.get('eTag'),
+                    'lastModifiedDateTime': item.get('lastModifiedDateTime'),
+                }
+            if '@odata.nextLink' not in resultJson:
+                break
+            requestURL = resultJson['@odata.nextLink']
+
+        def resolve_paths(drive_items):
+            # Delta responses carry no parentReference.path on SharePoint, so rebuild paths from parent ids
+            paths = {}
+            def resolve(item_id):
+                if item_id not in paths:
+                    item = drive_items.get(item_id)
+                    paths[item_id] = None
+                    if item is not None and item['root']:
+                        paths[item_id] = ''
+                    elif item is not None:
+                        parent = resolve(item['parentId'])
+                        paths[item_id] = None if parent is None else f"{parent}/{item['name']}".lstrip('/')
+                return paths[item_id]
+            return {
+                item_id: resolve(item_id) for item_id, item in drive_items.items()
+                if not item['folder'] and not item['root']
+            }
+
+        def in_scope(path):
+            return path is not None and (not folder_path or path.startswith(f'{folder_path}/'))
+
+        # The folder's view of the drive: the files in scope now and the ones reported by its last call
+        current_files = {
+            item_id: {
+                'path': path,
+                'id': item_id,
+                'size': items[item_id]['size'],
+                'eTag': items[item_id]['eTag'],
+                'lastModifiedDateTime': items[item_id]['lastModifiedDateTime'],
+            }
+            for item_id, path in resolve_paths(items).items() if in_scope(path)
+        }
+        previous_files = drive_state['folders'].get(folder_path, {})
+
+        result = {'added': [], 'modified': [], 'deleted': []}
+        for item_id, details in current_files.items():
+            if item_id not in previous_files:
+                result['added'].append(details)
+            elif previous_files[item_id]['eTag'] != details['eTag'] or previous_files[item_id]['path'] != details['path']:
+                result['modified'].append(details)
+        for item_id, details in previous_files.items():
+            if item_id not in current_files:
+                result['deleted'].append(details)
+
+        drive_state['folders'][folder_path] = current_files
+        state[site_id] = {'deltaLink': resultJson.get('@odata.deltaLink'), 'items': items, 'folders': drive_state['folders']}
+        temp_file = f'{state_file}.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp_file, state_file)
+        return result
+
     def search_item_details(self, **kwargs):
         """
         Search file properties in specific folder. 
@@ -535,22 +1493,26 @@ class microsoft_sharepoint:
         parentFolderName = kwargs.get('parentFolderName','')
         if kwargs.get('filePath',False):
             parentFolderName, fileName = kwargs.get('filePath').rsplit('/', 1)
-        crossCheck = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/"
+        crossCheck = f"{self.graph_url}/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/"
         if kwargs.get('fileURL', False):
             base64_encoded_link = (
                 base64.urlsafe_b64encode(kwargs.get('fileURL').encode("utf-8"))
                 .decode("utf-8")
                 .rstrip("=")
             )
-            crossCheck = f"https://graph.microsoft.com/v1.0/shares/u!{base64_encoded_link}/driveItem"
-        result = requests.get(crossCheck, headers=header)
-        if result.status_code != 200:
-            return False, f"Error fetching data: {result.status_code} - {result.text}"
+            crossCheck = f"{self.graph_url}/shares/u!{base64_encoded_link}/driveItem"
+        cache_key = ('share', kwargs.get('fileURL')) if kwargs.get('fileURL', False) else ('path', site_id, f'{parentFolderName}/{fileName}'.strip('/'))
+        cached = self.resolution_cache.get(cache_key)
+        if not cached or not cached.get('eTag') or not cached.get('downloadUrl'):
+            result = self.session.get(crossCheck, headers=header)
+            if result.status_code != 200:
+                return False, f"Error fetching data: {result.status_code} - {result.text}"
+            cached = self.remember_item(cache_key, result.json())
         if kwargs.get('get_download_url',False):
-            return result.json().get('@microsoft.graph.downloadUrl')
+            return cached.get('downloadUrl')
         if kwargs.get('get_filename', False):
-            return result.json().get('name')
-        checkID = re.search(r'\{(.+?)\}', result.json().get('eTag')).group(1).lower()
+            return cached.get('name')
+        checkID = re.search(r'\{(.+?)\}', cached.get('eTag')).group(1).lower()
         return checkID
     
     def read_item2(self, **kwargs):
@@ -567,47 +1529,154 @@ class microsoft_sharepoint:
                 - sheet_name (str, optional): The sheet name to read from (for Excel files). (Default is 'Sheet1').
                 - separator (str, optional): The separator to use for CSV/TXT files. (Default is ';').
                 - skip_row (int, optional): Rows to skip for TXT files. (Default is 1).
+                - use_cache (bool, optional): Reuse the download cache when `cache_dir` is set. (Default is True).
+                - cache_parsed (bool, optional): Also cache the parsed DataFrame as parquet. (Default is False).
+                - df_type (str, optional): 'pd' for Pandas, 'pl' for Polars or 'arrow' for a pyarrow Table. (Default is 'pd').
 
         Returns:
-            DataFrame: Pandas DataFrame with the file contents.
+            DataFrame: Pandas DataFrame (or Polars DataFrame / pyarrow Table) with the file contents.
         """
         site_id, list_id = self.check_group(**kwargs)
         if not kwargs.get('fileName') and not kwargs.get('parentFolderName') and not kwargs.get('filePath') and not kwargs.get('fileURL'):
             return False, 'There is no fileName, parentFolderName or fileURL to search!'
         header = self.get_token(**kwargs)
+        if self.download_cache is not None and kwargs.get('use_cache', True):
+            parentFolderName, fileName = kwargs.get('parentFolderName'), kwargs.get('fileName')
+            if kwargs.get('filePath', False):
+                parentFolderName, fileName = kwargs.get('filePath').rsplit('/', 1)
+            item = self.item_metadata(site_id, header, parentFolderName, fileName, kwargs.get('fileURL'))
+            if item is None:
+                return False, 'There is no file exist!'
+            return self.read_cached(item, **kwargs)
+        requests_url, fileName = self.content_url(site_id, header, **kwargs)
+        response = self.session.get(requests_url, headers=header)
+        if response.status_code != 200:
+            return False, f"Error fetching file: {response.status_code} - {response.text}"
+        file_content = BytesIO(response.content)
+        return self.parse_content(file_content, fileName, **kwargs)
+
+    def content_url(self, site_id: str, header: dict, **kwargs):
+        """
+        Resolve the `/content` url and file name of a file given by fileName and parentFolderName, filePath or fileURL.
+        """
         fileName = kwargs.get('fileName')
         parentFolderName = kwargs.get('parentFolderName')
         if kwargs.get('filePath', False):
             parentFolderName, fileName = kwargs.get('filePath').rsplit('/', 1)
-        requests_url = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/content"
+        requests_url = f"{self.graph_url}/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/content"
         if kwargs.get('fileURL', False):
             encoded_shared_url = (
                 base64.urlsafe_b64encode(kwargs.get('fileURL').encode("utf-8"))
                 .decode("utf-8")
                 .rstrip("=")
             )
-            temp_requests_url = f"https://graph.microsoft.com/v1.0/shares/u!{encoded_shared_url}/driveItem"
-            kwargs['get_filename'] = True
-            fileName = self.search_item_details(**kwargs)
-            kwargs['get_filename'] = False
-            response_temp = requests.get(temp_requests_url, headers=header)
-            requests_url = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drive/items/{response_temp.json().get('id')}/content"
-        response = requests.get(requests_url, headers=header)
-        file_content = BytesIO(response.content)
+            temp_requests_url = f"{self.graph_url}/shares/u!{encoded_shared_url}/driveItem?$select=id,name"
+            response_temp = self.session.get(temp_requests_url, headers=header).json()
+            fileName = response_temp.get('name')
+            requests_url = f"{self.graph_url}/sites/{site_id}/drive/items/{response_temp.get('id')}/content"
+        return requests_url, fileName
+
+    def read_item_chunks(self, chunksize: int = 100000, **kwargs):
+        """
+        Stream a csv, txt, zipped csv or parquet file from a SharePoint site as DataFrame chunks.
+
+        The download is spooled to a temporary file piece by piece, so memory stays bounded by one chunk
+        rather than the raw bytes plus the full DataFrame.
+
+        Args:
+            chunksize (int, optional): Rows per chunk for csv, txt and zip files (default is 100000).
+            kwargs: Same file arguments as `read_item2`.
+
+        Yields:
+            DataFrame: Pandas DataFrame chunks, one per row group for parquet files.
+        """
+        site_id, list_id = self.check_group(**kwargs)
+        if not kwargs.get('fileName') and not kwargs.get('parentFolderName') and not kwargs.get('filePath') and not kwargs.get('fileURL'):
+            raise ValueError('There is no fileName, parentFolderName or fileURL to search!')
+        header = self.get_token(**kwargs)
+        requests_url, fileName = self.content_url(site_id, header, **kwargs)
         file_extension = fileName.split('.')[-1].lower()
-        if file_extension == 'csv':   
-            return pd.read_csv(file_content)
-        elif file_extension == 'py':
-            return self.download_item(**kwargs)
-        elif file_extension == 'xlsb':
-            return pd.read_excel(file_content, sheet_name=kwargs.get('sheet_name','Sheet1'), engine='pyxlsb')
-        elif file_extension == 'xlsx':
-            return pd.read_excel(file_content, sheet_name=kwargs.get('sheet_name','Sheet1'), engine='openpyxl')
-        elif file_extension == 'zip':
-            with zipfile.ZipFile(file_content, 'r') as z:
-                with z.open(z.namelist()[0]) as f:
-                    return pd.read_csv(f)
-        elif file_extension == 'txt':
-            file_content.seek(0) 
-            return pd.read_csv(file_content, sep=kwargs.get('separator',';'), skiprows=kwargs.get('skip_row',1))
-        return pd.read_excel(file_content, sheet_name=kwargs.get('sheet_name','Sheet1'))
+        if file_extension not in ('csv', 'txt', 'zip', 'parquet'):
+            raise ValueError(f'Chunked reading is not supported for .{file_extension} files!')
+        with tempfile.TemporaryFile() as spool:
+            with self.session.get(requests_url, headers=header, stream=True) as response:
+                response.raise_for_status()
+                for block in response.iter_content(chunk_size=1024 * 1024):
+                    spool.write(block)
+            spool.seek(0)
+            if file_extension == 'parquet':
+                parquet_file = pq.ParquetFile(spool)
+                for row_group in range(parquet_file.num_row_groups):
+                    yield parquet_file.read_row_group(row_group).to_pandas()
+            elif file_extension == 'zip':
+                with zipfile.ZipFile(spool, 'r') as z:
+                    with z.open(z.namelist()[0]) as f:
+                        with pd.read_csv(f, chunksize=chunksize) as reader:
+                            yield from reader
+            elif file_extension == 'txt':
+                with pd.read_csv(spool, sep=kwargs.get('separator',';'), skiprows=kwargs.get('skip_row',1), chunksize=chunksize) as reader:
+                    yield from reader
+            else:
+                with pd.read_csv(spool, chunksize=chunksize) as reader:
+                    yield from reader
+
+    def read_items(self, filePaths: list = None, parentFolderName: str = None, pattern: str = '*', max_workers: int = 8, concat: bool = True, **kwargs):
+        """
+        Download and parse several files concurrently with `read_item2`.
+
+        Args:
+            filePaths (list, optional): The file paths to read. Required if `parentFolderName` is not provided.
+            parentFolderName (str, optional): Read the files in this folder whose names match `pattern`.
+            pattern (str, optional): Glob pattern for file names in `parentFolderName` (default is '*').
+            max_workers (int, optional): Files downloaded at the same time (default is 8).
+            concat (bool, optional): Return one concatenated DataFrame instead of a dict keyed by path (default is True).
+                Results that are not tables are left out. If the frames cannot be concatenated the dict is
+                returned with the error under failures['concat'].
+            kwargs: Other `read_item2` arguments such as group, sheet_name, separator or skip_row.
+
+        Returns:
+            tuple: The DataFrame (or dict of DataFrames) of the files read, and a dict of path -> error for the files that failed.
+        """
+        if filePaths is None:
+            if not parentFolderName:
+                return False, 'There is no filePaths or parentFolderName to read!'
+            filePaths = [
+                item['path'] for item in self.crawl_folder(parentFolderName, max_depth=0, **kwargs)
+                if fnmatch.fnmatch(item['path'].rsplit('/', 1)[-1], pattern)
+            ]
+
+        def read(filePath):
+            result = self.read_item2(filePath=filePath, **kwargs)
+            if isinstance(result, tuple):
+                raise ValueError(result[1])
+            return result
+
+        results = {}
+        failures = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(read, filePath): filePath for filePath in filePaths}
+            for future, filePath in futures.items():
+                try:
+                    results[filePath] = future.result()
+                except Exception as e:
+                    failures[filePath] = f'{type(e).__name__}: {e}'
+        if concat:
+            # Only parsed tables are concatenated, e.g. `.py` files are downloaded and return True
+            frames = [
+                results[filePath] for filePath in filePaths
+                if isinstance(results.get(filePath), (pd.DataFrame, pl.DataFrame, pa.Table))
+            ]
+            try:
+                return self.concat_frames(frames, kwargs.get('df_type', 'pd')), failures
+            except Exception as e:
+                failures['concat'] = f'{type(e).__name__}: {e}'
+                return results, failures
+        return results, failures
+
+    def concat_frames(self, frames: list, df_type: str = 'pd'):
+        """Concatenate Pandas, Polars or Arrow frames, filling columns missing from some of them with nulls."""
+        if df_type == 'pl':
+            return pl.concat(frames, how='diagonal_relaxed') if frames else pl.DataFrame()
+        if df_type == 'arrow':
+            return pa.concat_tables(frames, promote_options='permissive') if frames else pa.table({})
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
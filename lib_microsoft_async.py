@@ -0,0 +1,243 @@
+from dataclasses import dataclass, field
+import asyncio
+import base64
+import inspect
+import os
+import re
+from io import BytesIO
+import httpx
+import pandas as pd
+from lib_microsoft import microsoft_sharepoint
+
+@dataclass
+class async_microsoft_sharepoint:
+    """
+    Asyncio variant of the core `microsoft_sharepoint` methods.
+
+    Configuration, group/site resolution, token caching, parsing and the audit log are shared with the
+    wrapped sync client, so both can be used side by side. At most `max_concurrency` Graph requests are
+    in flight at once. Point `sharepoint.graph_url` and `sharepoint.login_url` at a local server to test.
+
+    Usage:
+        async with async_microsoft_sharepoint(microsoft_sharepoint()) as sp:
+            frames = await asyncio.gather(*(sp.read_item2(filePath=path) for path in paths))
+    """
+    sharepoint: microsoft_sharepoint = field(default_factory=microsoft_sharepoint)
+    max_concurrency: int = 20
+    timeout: float = 60
+    client: httpx.AsyncClient = field(default=None, init=False, repr=False)
+    semaphore: asyncio.Semaphore = field(default=None, init=False, repr=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def get_token(self, **kwargs):
+        # Cached tokens return immediately, only a refresh blocks a worker thread
+        return await asyncio.to_thread(self.sharepoint.get_token, **kwargs)
+
+    async def update_log(self, **kwargs):
+        return await asyncio.to_thread(self.sharepoint.update_log, **kwargs)
+
+    async def request(self, method: str, url: str, **kwargs):
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency),
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Throttled (429) and unavailable (503) responses are retried after their Retry-After, like the
+        # sync session does. The wait happens outside the semaphore so other requests keep going
+        for attempt in range(self.sharepoint.throttle_retries + 1):
+            async with self.semaphore:
+                response = await self.client.request(method, url, **kwargs)
+            if response.status_code not in (429, 503) or attempt == self.sharepoint.throttle_retries:
+                return response
+            retry_after = response.headers.get('Retry-After')
+            await asyncio.sleep(float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt)
+
+    async def list_children(self, requestURL: str, header: dict):
+        """Return every item behind `requestURL`, following @odata.nextLink, and the last status code."""
+        result = []
+        while requestURL:
+            response = await self.request('GET', requestURL, headers=header)
+            if response.status_code != 200:
+                # An error body has no items, stop and let the caller see the status
+                break
+            resultJson = response.json()
+            result += resultJson.get('value', [])
+            requestURL = resultJson.get('@odata.nextLink')
+        return result, response.status_code
+
+    async def list_files(self, **kwargs):
+        site_id, list_id = self.sharepoint.check_group(**kwargs)
+        if not kwargs.get('parentFolderID') and not kwargs.get('parentFolderName'):
+            return False, 'There is no parentFolderID and parentFolderName to search!'
+        header = await self.get_token(**kwargs)
+        graph_url = self.sharepoint.graph_url
+        if kwargs.get('parentFolderID'):
+            requestURL = f'{graph_url}/sites/{site_id}/lists/{list_id}/items/{kwargs.get("parentFolderID")}/driveItem/children'
+        if kwargs.get('parentFolderName'):
+            requestURL = f'{graph_url}/sites/{site_id}/drive/root:/{kwargs.get("parentFolderName")}:/children'
+        items, status_code = await self.list_children(requestURL, header)
+        list_files_only = kwargs.get('files_only', False)
+        list_folders_only = kwargs.get('folders_only', False)
+        result = [
+            item.get('name') for item in items
+            if not (list_files_only and 'folder' in item) and not (list_folders_only and 'folder' not in item)
+        ]
+        log_kwargs = {
+            'function_used':inspect.currentframe().f_code.co_name,
+            'kwargs': kwargs,
+            'response_code':status_code,
+        }
+        await self.update_log(**log_kwargs)
+        if status_code != 200:
+            return False, f"Error listing files: {status_code}"
+        if kwargs.get('returnTuple', False):
+            return tuple(result)
+        return result
+
+    async def search_item_details(self, **kwargs):
+        """
+        Async `microsoft_sharepoint.search_item_details`, sharing its resolution cache.
+        """
+        site_id, list_id = self.sharepoint.check_group(**kwargs)
+        if not kwargs.get('fileName') and not kwargs.get('parentFolderName') and not kwargs.get('filePath') and not kwargs.get('fileURL'):
+            return False, 'There is no fileName and parentFolderName or filePath or fileURL to search!'
+        header = await self.get_token(**kwargs)
+        graph_url = self.sharepoint.graph_url
+        fileName = kwargs.get('fileName','')
+        parentFolderName = kwargs.get('parentFolderName','')
+        if kwargs.get('filePath',False):
+            parentFolderName, fileName = kwargs.get('filePath').rsplit('/', 1)
+        crossCheck = f"{graph_url}/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/"
+        cache_key = ('path', site_id, f'{parentFolderName}/{fileName}'.strip('/'))
+        if kwargs.get('fileURL', False):
+            base64_encoded_link = (
+                base64.urlsafe_b64encode(kwargs.get('fileURL').encode("utf-8"))
+                .decode("utf-8")
+                .rstrip("=")
+            )
+            crossCheck = f"{graph_url}/shares/u!{base64_encoded_link}/driveItem"
+            cache_key = ('share', kwargs.get('fileURL'))
+        cached = self.sharepoint.resolution_cache.get(cache_key)
+        if not cached or not cached.get('eTag') or not cached.get('downloadUrl'):
+            result = await self.request('GET', crossCheck, headers=header)
+            if result.status_code != 200:
+                return False, f"Error fetching data: {result.status_code} - {result.text}"
+            cached = self.sharepoint.remember_item(cache_key, result.json())
+        if kwargs.get('get_download_url',False):
+            return cached.get('downloadUrl')
+        if kwargs.get('get_filename', False):
+            return cached.get('name')
+        return re.search(r'\{(.+?)\}', cached.get('eTag')).group(1).lower()
+
+    async def read_item2(self, **kwargs):
+        """
+        Async `microsoft_sharepoint.read_item2`. Parsing runs in a worker thread so the event loop stays free.
+        """
+        site_id, list_id = self.sharepoint.check_group(**kwargs)
+        if not kwargs.get('fileName') and not kwargs.get('parentFolderName') and not kwargs.get('filePath') and not kwargs.get('fileURL'):
+            return False, 'There is no fileName, parentFolderName or fileURL to search!'
+        header = await self.get_token(**kwargs)
+        graph_url = self.sharepoint.graph_url
+        fileName = kwargs.get('fileName')
+        parentFolderName = kwargs.get('parentFolderName')
+        if kwargs.get('filePath', False):
+            parentFolderName, fileName = kwargs.get('filePath').rsplit('/', 1)
+        requests_url = f"{graph_url}/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/content"
+        if kwargs.get('fileURL', False):
+            encoded_shared_url = (
+                base64.urlsafe_b64encode(kwargs.get('fileURL').encode("utf-8"))
+                .decode("utf-8")
+                .rstrip("=")
+            )
+            response_temp = await self.request('GET', f"{graph_url}/shares/u!{encoded_shared_url}/driveItem?$select=id,name", headers=header)
+            if response_temp.status_code != 200:
+                return False, f"Error fetching data: {response_temp.status_code} - {response_temp.text}"
+            fileName = response_temp.json().get('name')
+            requests_url = f"{graph_url}/sites/{site_id}/drive/items/{response_temp.json().get('id')}/content"
+        response = await self.request('GET', requests_url, headers=header)
+        if response.status_code != 200:
+            return False, f"Error fetching file: {response.status_code} - {response.text}"
+        return await asyncio.to_thread(self.sharepoint.parse_content, BytesIO(response.content), fileName, **kwargs)
+
+    async def upload_item(self, **kwargs):
+        """
+        Async `microsoft_sharepoint.upload_item`. Large files go through the sync upload session in a worker thread.
+        """
+        site_id, list_id = self.sharepoint.check_group(**kwargs)
+        if not kwargs.get('fileName') and not kwargs.get('parentFolderName') and not kwargs.get('fileURL'):
+            return False, 'There is no fileName, parentFolderName or fileURL to search!'
+        fileName = kwargs.get('fileName')
+        parentFolderName = kwargs.get('parentFolderName')
+        if kwargs.get('fileURL'):
+            parentFolderName, fileName = kwargs.get('fileURL').rsplit('/', 1)
+        local_path = f".{kwargs.get('fileLocated')}/{fileName}"
+        file_size = os.path.getsize(local_path)
+        if kwargs.get('large_file', file_size > 4 * 1024 * 1024) and file_size > 0:
+            return await asyncio.to_thread(self.sharepoint.upload_item, **kwargs)
+        header = await self.get_token()
+
+        def read_file():
+            with open(local_path, 'rb') as f:
+                return f.read()
+        data = await asyncio.to_thread(read_file)
+        requests_url = f"{self.sharepoint.graph_url}/sites/{site_id}/drive/root:/{parentFolderName}/{fileName}:/content"
+        response = await self.request('PUT', requests_url, headers=header, content=data)
+        log_kwargs = {
+            'function_used':inspect.currentframe().f_code.co_name,
+            'kwargs': kwargs,
+            'response_code':response.status_code,
+        }
+        await self.update_log(**log_kwargs)
+        if response.status_code == 201 or response.status_code == 200:
+            path = f'{parentFolderName}/{fileName}'.strip('/')
+            self.sharepoint.resolution_cache.invalidate(('path', site_id, path), path=path)
+            return True
+        return False
+
+    async def get_group_details(self):
+        header = await self.get_token()
+        requests_url = f"{self.sharepoint.graph_url}/groups?$filter=mailEnabled eq false&securityEnabled eq true"
+        result, status_code = await self.list_children(requests_url, header)
+        if result != []:
+            return pd.DataFrame(result)
+        return result
+
+    async def get_groupmember_details(self, **kwargs):
+        groupName = kwargs.get('group_name',False)
+        if not groupName:
+            return pd.DataFrame()
+        if type(groupName) != list:
+            groupName = [groupName]
+        header = await self.get_token()
+        groupDf = await self.get_group_details()
+        if len(groupDf) == 0:
+            return pd.DataFrame()
+        groupDf = groupDf[groupDf['displayName'].isin(groupName)].drop_duplicates('id')
+        if groupDf.empty:
+            return pd.DataFrame()
+
+        async def fetch_members(groupId, displayName):
+            result, status_code = await self.list_children(f"{self.sharepoint.graph_url}/groups/{groupId}/members", header)
+            groupResult = pd.DataFrame(result)
+            groupResult['groupName'] = displayName
+            return groupResult
+
+        finalDf = await asyncio.gather(*(
+            fetch_members(groupId, displayName) for groupId, displayName in zip(groupDf['id'], groupDf['displayName'])
+        ))
+        finalResult = pd.concat(finalDf)
+        if not finalResult.empty:
+            return finalResult
+        return pd.DataFrame()
@@ -1,12 +1,19 @@
 import connectorx as cx
 import sqlalchemy
 import pandas as pd
+import math
 import os 
-from jinja2 import Template
+import re
+import tempfile
+import threading
+from jinja2 import Environment, Template, nodes
+from functools import lru_cache
 from datetime import datetime
 from urllib.parse import quote_plus
 import pytz
 import polars as pl
+import pyarrow as pa
+from mysql.connector import FieldType
 
 def is_numeric(value):
     """Check if a value is numeric (including negative numbers and floats)."""
@@ -16,21 +23,155 @@ def is_numeric(value):
     except ValueError:
         return False
     
+@lru_cache(maxsize=256)
+def load_template(file_name: str, mtime_ns: int):
+    """Compiled template of a SQL file, cached until the file's modification time changes."""
+    with open(
+            f"{file_name}", "r", encoding="utf-8"
+    ) as file:
+        return Template(file.read())
+
+@lru_cache(maxsize=256)
+def load_bound_template(file_name: str, mtime_ns: int):
+    """
+    Compiled template of a SQL file in which every `{{ expression }}` output is passed through a
+    `_bind(key, names, value)` callable from the render context, with `key` the variable name for a
+    bare `{{ variable }}` and `names` the variables the expression reads.
+    """
+    env = Environment()
+    with open(
+            f"{file_name}", "r", encoding="utf-8"
+    ) as file:
+        tree = env.parse(file.read())
+    for output in tree.find_all(nodes.Output):
+        output.nodes = [
+            node if isinstance(node, nodes.TemplateData) else nodes.Call(
+                nodes.Name('_bind', 'load', lineno=node.lineno),
+                [
+                    nodes.Const(node.name if isinstance(node, nodes.Name) else None, lineno=node.lineno),
+                    nodes.Const(
+                        tuple({name.name for name in node.find_all(nodes.Name)} | ({node.name} if isinstance(node, nodes.Name) else set())),
+                        lineno=node.lineno
+                    ),
+                    node,
+                ],
+                [], None, None, lineno=node.lineno
+            )
+            for node in output.nodes
+        ]
+    return env.from_string(tree)
+
+def bind_value(value):
+    """Bind numeric strings as numbers, as `sql_statement` inlines them unquoted (`{'n': '10'}` -> LIMIT 10)."""
+    if isinstance(value, str) and is_numeric(value) and math.isfinite(float(value)):
+        return int(value) if re.fullmatch(r'\s*[-+]?\d+\s*', value) else float(value)
+    return value
+
+def top_level_select(query: str):
+    """
+    Return the select list items and the first table of the top-level FROM of a SELECT query.
+
+    Parenthesised text (subqueries, CTE bodies, calls such as `EXTRACT(YEAR FROM col)`) and string
+    literals are skipped. The table is None when the query has no plain top-level FROM.
+    """
+    flat = re.sub(r"'(?:[^'\\]|\\.)*'", lambda m: ' ' * len(m.group(0)), query)
+    depth, chars = 0, []
+    for char in flat:
+        depth += char == '('
+        chars.append(char if depth == 0 else ' ')
+        depth -= char == ')' and depth > 0
+    flat = ''.join(chars)
+    select = re.search(r"\bselect\b", flat, re.IGNORECASE)
+    if select is None:
+        return [], None
+    table = re.compile(r"\bfrom\s+(`?\w+`?(?:\.`?\w+`?)?)", re.IGNORECASE).search(flat, select.end())
+    end = table.start() if table else len(flat)
+    items, start = [], select.end()
+    for comma in [m.start() for m in re.finditer(',', flat[:end])] + [end]:
+        if comma >= start:
+            items.append(query[start:comma].strip())
+            start = comma + 1
+    return items, table.group(1) if table else None
+
+def selects_column(items: list, column: str):
+    """Whether a select list returns `column`, as `*`, `t.*`, the column itself or an alias of that name."""
+    for item in items:
+        if item == '*' or item.endswith('.*'):
+            return True
+        name = re.search(r"`?(\w+)`?\s*$", item)
+        if name and name.group(1).lower() == column.lower():
+            return True
+    return False
+
+@lru_cache(maxsize=256)
+def compile_template(query: str):
+    """Compiled template of a query string."""
+    return Template(query)
+
+# Polars dtypes of MySQL result columns, so every streamed chunk gets the same schema.
+# DECIMAL becomes Float64 like read_query's coerce_float
+POLARS_FIELD_TYPES = {
+    FieldType.TINY: pl.Int64,
+    FieldType.SHORT: pl.Int64,
+    FieldType.INT24: pl.Int64,
+    FieldType.LONG: pl.Int64,
+    FieldType.LONGLONG: pl.Int64,
+    FieldType.YEAR: pl.Int64,
+    FieldType.FLOAT: pl.Float64,
+    FieldType.DOUBLE: pl.Float64,
+    FieldType.DECIMAL: pl.Float64,
+    FieldType.NEWDECIMAL: pl.Float64,
+    FieldType.DATE: pl.Date,
+    FieldType.DATETIME: pl.Datetime('us'),
+    FieldType.TIMESTAMP: pl.Datetime('us'),
+    FieldType.TIME: pl.Duration('us'),
+    FieldType.VARCHAR: pl.String,
+    FieldType.VAR_STRING: pl.String,
+    FieldType.STRING: pl.String,
+    FieldType.ENUM: pl.String,
+    FieldType.SET: pl.String,
+    FieldType.JSON: pl.String,
+}
+
+# ER_NOT_ALLOWED_COMMAND, CR_LOAD_DATA_LOCAL_INFILE_REJECTED, ER_CLIENT_LOCAL_FILES_DISABLED
+LOCAL_INFILE_REFUSED = (1148, 2068, 3948)
+
 class MySQL:
-    def __init__(self, server, username, password, port_num):
+    def __init__(
+            self,
+            server,
+            username,
+            password,
+            port_num,
+            pool_size: int = 5,
+            max_overflow: int = 10,
+            pool_recycle: int = 3600,
+            pool_pre_ping: bool = True,
+            pool_timeout: int = 30,
+            allow_local_infile: bool = False,
+            ):
         self.server = server
         self.username = username
         self.password = password
         self.port_num = port_num
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        self.pool_timeout = pool_timeout
+        self.allow_local_infile = allow_local_infile
+        self._engine = None
+        self._engine_lock = threading.Lock()
 
     @classmethod
-    def from_env(cls, conn_name: str):
+    def from_env(cls, conn_name: str, **kwargs):
         prefix = conn_name.upper()
         return cls(
             server=os.getenv(f"{prefix}_SERVER"),
             username=os.getenv(f"{prefix}_USERNAME"),
             password=os.getenv(f"{prefix}_PASSWORD"),
             port_num=int(os.getenv(f"{prefix}_PORT")),
+            **kwargs,
         )
     
     def database_url(self):
@@ -40,29 +181,83 @@ class MySQL:
         return mysql_url
     
     def database_engine(self):
-        encoded_username = quote_plus(self.username)
-        encoded_password = quote_plus(self.password)
-        return sqlalchemy.create_engine(
-        url=f"mysql+mysqlconnector://{encoded_username}:{encoded_password}@{self.server}:{self.port_num}"
-        )
+        """
+        Return the engine shared by every call on this instance, creating it on first use.
+
+        Connections are pooled (QueuePool) and checked with a ping before being handed out, so
+        repeated queries skip the connection handshake. The engine is safe to share across threads.
+        """
+        if self._engine is None:
+            with self._engine_lock:
+                if self._engine is None:
+                    encoded_username = quote_plus(self.username)
+                    encoded_password = quote_plus(self.password)
+                    self._engine = sqlalchemy.create_engine(
+                    url=f"mysql+mysqlconnector://{encoded_username}:{encoded_password}@{self.server}:{self.port_num}",
+                    poolclass=sqlalchemy.pool.QueuePool,
+                    pool_size=self.pool_size,
+                    max_overflow=self.max_overflow,
+                    pool_recycle=self.pool_recycle,
+                    pool_pre_ping=self.pool_pre_ping,
+                    pool_timeout=self.pool_timeout,
+                    connect_args={'allow_local_infile': True} if self.allow_local_infile else {},
+                    )
+        return self._engine
+
+    def dispose(self):
+        """Close every pooled connection. The next call creates a fresh engine."""
+        with self._engine_lock:
+            if self._engine is not None:
+                self._engine.dispose()
+                self._engine = None
     
+    def template(self, file_name: str):
+        return load_template(file_name, os.stat(file_name).st_mtime_ns)
+
     def sql_statement(self,file_name: str, variables: dict = {}):
-        with open(
-                f"{file_name}", "r", encoding="utf-8"
-        ) as file:
-            sql_template = Template(file.read())
-
-            formatted_variables = {
-                  k: f"'{v}'" if not is_numeric(v) else v 
-                  for k,v in variables.items()
-            }
-            rendered_sql = sql_template.render(**formatted_variables)
+        """Render a SQL file with the values inlined as literals (for connectorx, which cannot bind parameters)."""
+        sql_template = self.template(file_name)
+
+        formatted_variables = {
+              k: f"'{v}'" if not is_numeric(v) else v 
+              for k,v in variables.items()
+        }
+        rendered_sql = sql_template.render(**formatted_variables)
         return rendered_sql
 
+    def bound_statement(self, file_name: str, variables: dict = {}, paramstyle: str = 'named'):
+        """
+        Render a SQL file with each `{{ ... }}` that reads a scalar variable as a bind placeholder instead of a literal.
+
+        Returns the SQL and its parameters: a dict for 'named' (`:name`, for sqlalchemy.text) or a list
+        in placeholder order for 'format' (`%s`, for mysql-connector cursors). Tags such as
+        `{% if limit > 0 %}` see the real values, and an expression like `{{ region|upper }}` or
+        `{{ limit + 1 }}` is bound as its result. Numeric strings are bound as numbers, like
+        `sql_statement` inlines them. Lists, tuples and dicts are passed to the template as they are,
+        e.g. for loops, and their items are inlined.
+        """
+        scalars = {k for k, v in variables.items() if not isinstance(v, (list, tuple, dict))}
+        params = {} if paramstyle == 'named' else []
+
+        def bind(key, names, value):
+            if scalars.isdisjoint(names):
+                # Loop variables, list items and literals are inlined as before
+                return value
+            if paramstyle == 'named':
+                key = key or f"_expr{len(params)}"
+                params[key] = bind_value(value)
+                return f":{key}"
+            params.append(bind_value(value))
+            return '%s'
+
+        template = load_bound_template(file_name, os.stat(file_name).st_mtime_ns)
+        return template.render(**variables, _bind=bind), params
+
     def read_sql_file(self,file_name: str, variables: dict = {}):
         
-        # Split the SQL script into individual statements
-        sql_statements = self.sql_statement(file_name, variables).split(';')
+        # Split the SQL script into individual statements, values stay bind parameters
+        sql_script, params = self.bound_statement(file_name, variables)
+        sql_statements = sql_script.split(';')
         
         # Remove any empty statements
         sql_statements = [stmt.strip() for stmt in sql_statements if stmt.strip()]
@@ -71,28 +266,196 @@ class MySQL:
             for statement in sql_statements:
                 if statement.lower().startswith(('select', 'with')):
                     # Execute the SELECT statement and store the result
-                    result_df = pd.read_sql_query(sql=sqlalchemy.text(statement), con=conn)
+                    result_df = pd.read_sql_query(sql=sqlalchemy.text(statement), con=conn, params=params)
                 else:
                     # Execute other statements (e.g., USE, INSERT, UPDATE)
-                    conn.execute(sqlalchemy.text(statement))
+                    conn.execute(sqlalchemy.text(statement), params)
         return result_df
 
+    def read_sql_file_many(self, file_name: str, variable_sets: list, df_type: str = 'pd'):
+        """
+        Run a single-statement SQL file once per dict in `variable_sets`, yielding one frame per set.
+
+        Each set is rendered with bind parameters and executed as a server-side prepared statement,
+        which is prepared once and reused for as long as the rendered SQL stays the same.
+
+        Usage:
+            for customer, df in zip(customers, db.read_sql_file_many('orders.sql', [{'customer_id': c} for c in customers])):
+                ...
+        """
+        if not variable_sets:
+            return
+        with self.database_engine().connect() as conn:
+            cursor = conn.connection.dbapi_connection.cursor(prepared=True)
+            statement = None
+            try:
+                for variables in variable_sets:
+                    rendered, params = self.bound_statement(file_name, variables, 'format')
+                    rendered = rendered.strip().rstrip(';')
+                    if ';' in rendered:
+                        raise ValueError(f"{file_name} must contain a single statement")
+                    # The cursor re-prepares whenever it gets a different string object
+                    if rendered != statement:
+                        statement = rendered
+                    cursor.execute(statement, params)
+                    rows = cursor.fetchall()
+                    columns = [column[0] for column in cursor.description]
+                    if df_type == 'pl':
+                        yield pl.DataFrame(rows, schema=columns, orient='row', infer_schema_length=None)
+                    else:
+                        yield pd.DataFrame.from_records(rows, columns=columns)
+            finally:
+                cursor.close()
+
     def read_query(self,query:str,variables: dict = {}):
-        sql_template = Template(query)
+        sql_template = compile_template(query)
         rendered_sql = sql_template.render(**variables)
 
         with self.database_engine().connect() as conn:
             df = pd.read_sql_query(sql=sqlalchemy.text(rendered_sql), con=conn)
             return df
     
-    def connx(self,file_name: str,df_type: str ='pl', variables: dict = {}):
-        if df_type =='pd':
-            df = cx.read_sql(self.database_url(), self.sql_statement(file_name,variables))
-        else:
-            df = pl.read_database_uri(self.sql_statement(file_name,variables), uri =self.database_url(),engine='connectorx')
-        return df
+    def stream_statement(self, conn, statement: str, chunksize: int, df_type: str = 'pd', params: list = None):
+        """
+        Yield the result of `statement` in frames of `chunksize` rows, read through an unbuffered
+        cursor on `conn` so only one chunk is held in memory. `params` fill its `%s` placeholders.
+        """
+        # SQLAlchemy's mysqlconnector dialect has no server-side cursors, so stream_results would
+        # still buffer the whole result; use an unbuffered DBAPI cursor instead
+        cursor = conn.connection.dbapi_connection.cursor(buffered=False)
+        finished = False
+        try:
+            cursor.execute(statement, params or None)
+            columns = [column[0] for column in cursor.description]
+            schema = None
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                if df_type == 'pl':
+                    if schema is None:
+                        # Types come from the result metadata, only unmapped columns are inferred from the
+                        # first chunk, then the schema is fixed so an all-null chunk can't change a dtype
+                        overrides = {column[0]: POLARS_FIELD_TYPES[column[1]] for column in cursor.description if column[1] in POLARS_FIELD_TYPES}
+                        chunk = pl.DataFrame(rows, schema=columns, orient='row', schema_overrides=overrides, infer_schema_length=None)
+                        schema = {name: pl.String if dtype == pl.Null else dtype for name, dtype in chunk.schema.items()}
+                        yield chunk.cast(schema)
+                    else:
+                        yield pl.DataFrame(rows, schema=schema, orient='row')
+                else:
+                    yield pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+            finished = True
+        finally:
+            if finished:
+                cursor.close()
+            else:
+                # Stopped early: drop the connection rather than draining the remaining rows
+                conn.invalidate()
+
+    def read_sql_file_chunks(self, file_name: str, variables: dict = {}, chunksize: int = 100000, df_type: str = 'pd'):
+        """
+        Generator variant of `read_sql_file`: yields the result of the last SELECT in chunks of
+        `chunksize` rows as Pandas ('pd') or Polars ('pl') DataFrames, in constant memory. Values are
+        bound as parameters like in `read_sql_file`.
+        """
+        sql_script, params = self.bound_statement(file_name, variables, 'format')
+        sql_statements = [stmt.strip() for stmt in sql_script.split(';') if stmt.strip()]
+        # Hand each statement the positional parameters of its own placeholders
+        statement_params = []
+        for statement in sql_statements:
+            count = statement.count('%s')
+            statement_params.append(tuple(params[:count]))
+            params = params[count:]
+        select_index = max(
+            (i for i, statement in enumerate(sql_statements) if statement.lower().startswith(('select', 'with'))),
+            default=None
+        )
+        if select_index is None:
+            raise ValueError(f"{file_name} has no SELECT statement")
+
+        with self.database_engine().connect() as conn:
+            for statement, statement_param in zip(sql_statements[:select_index], statement_params):
+                if not statement.lower().startswith(('select', 'with')):
+                    conn.exec_driver_sql(statement, statement_param)
+            conn.commit()
+            yield from self.stream_statement(conn, sql_statements[select_index], chunksize, df_type, statement_params[select_index])
+            for statement, statement_param in zip(sql_statements[select_index + 1:], statement_params[select_index + 1:]):
+                conn.exec_driver_sql(statement, statement_param)
+            conn.commit()
+
+    def read_query_chunks(self, query: str, variables: dict = {}, chunksize: int = 100000, df_type: str = 'pd'):
+        """
+        Generator variant of `read_query`: yields the result in chunks of `chunksize` rows as Pandas ('pd')
+        or Polars ('pl') DataFrames, in constant memory.
+
+        Usage:
+            for chunk in db.read_query_chunks("SELECT * FROM sales.orders", chunksize=500000):
+                db.load_data(chunk, 'orders', 'archive', method='append', bulk=True)
+        """
+        rendered_sql = compile_template(query).render(**variables)
+        with self.database_engine().connect() as conn:
+            yield from self.stream_statement(conn, rendered_sql, chunksize, df_type)
+
+    def numeric_primary_key(self, table_name: str):
+        """
+        Return the primary key column of `table_name` if it is a single integer column, else None.
+        An unqualified name is looked up in the connection's default schema.
+        """
+        schema_name, _, table_name = table_name.replace('`', '').rpartition('.')
+        query = sqlalchemy.text(
+            "SELECT column_name, data_type FROM information_schema.columns "
+            "WHERE table_schema = COALESCE(NULLIF(:schema_name, ''), DATABASE()) AND table_name = :table_name AND column_key = 'PRI'"
+        )
+        with self.database_engine().connect() as conn:
+            rows = conn.execute(query, {'schema_name': schema_name, 'table_name': table_name}).fetchall()
+        if len(rows) == 1 and rows[0][1].lower() in ('tinyint', 'smallint', 'mediumint', 'int', 'bigint'):
+            return rows[0][0]
+        return None
 
-    def get_column_dtypes(self, df: pd.DataFrame, custom_dtype: dict):
+    def connx(
+            self,
+            file_name: str,
+            df_type: str ='pl',
+            variables: dict = {},
+            partition_on: str = None,
+            partition_num: int = None,
+            partition_range: tuple = None,
+            partition_table: str = None,
+            ):
+        """
+        Read a SQL file through connectorx into a Pandas ('pd') or Polars ('pl') DataFrame, or a pyarrow Table ('arrow').
+
+        With `partition_num` the query is split into ranges of `partition_on` that are read over that many
+        connections in parallel. Without `partition_on` the single integer primary key of `partition_table`
+        ("schema.table", taken from the query's top-level FROM clause if not given) is used, and ValueError
+        is raised if there is none or the query does not select it. connectorx looks up the min/max itself unless `partition_range` is passed. The
+        query must be a single SELECT.
+        """
+        query = self.sql_statement(file_name,variables)
+        partition_kwargs = {}
+        if partition_num:
+            if not partition_on:
+                select_items, from_table = top_level_select(query)
+                partition_table = partition_table or from_table
+                if partition_table:
+                    partition_on = self.numeric_primary_key(partition_table)
+                # connectorx partitions on a column of the result, the key must be selected
+                if partition_on and not selects_column(select_items, partition_on):
+                    partition_on = None
+                if not partition_on:
+                    raise ValueError(
+                        f"partition_num={partition_num} needs partition_on: no single integer primary key of "
+                        f"{partition_table or 'the query'} is selected, pass partition_on or a 'schema.table' partition_table"
+                    )
+            partition_kwargs = {'partition_on': partition_on, 'partition_num': partition_num}
+            if partition_range:
+                partition_kwargs['partition_range'] = partition_range
+        return_type = {'pd': 'pandas', 'pl': 'polars', 'arrow': 'arrow'}[df_type]
+        return cx.read_sql(self.database_url(), query, return_type=return_type, **partition_kwargs)
+
+    def get_column_dtypes(self, df, custom_dtype: dict):
+        if not isinstance(df, pd.DataFrame):
+            return self.get_arrow_column_dtypes(df, custom_dtype)
         dtypedict = {}
         for i, j in zip(df.columns, df.dtypes):
             if "object" in str(j):
@@ -112,28 +475,311 @@ class MySQL:
                 dtypedict.update({key: value})
         return dtypedict
 
-    def generate_updated_time_column(self, df: pd.DataFrame):
+    def get_arrow_column_dtypes(self, df, custom_dtype: dict):
+        """`get_column_dtypes` for Polars DataFrames and pyarrow Tables, mapped from the Arrow schema."""
+        schema = df.schema if isinstance(df, pa.Table) else df.head(0).to_arrow().schema
+        dtypedict = {}
+        for field in schema:
+            arrow_type = field.type
+            if pa.types.is_dictionary(arrow_type):
+                arrow_type = arrow_type.value_type
+            if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type) or pa.types.is_string_view(arrow_type):
+                dtypedict.update({field.name: sqlalchemy.types.NVARCHAR(length=255)})
+            elif pa.types.is_timestamp(arrow_type):
+                dtypedict.update({field.name: sqlalchemy.types.DateTime()})
+            elif pa.types.is_date(arrow_type):
+                dtypedict.update({field.name: sqlalchemy.types.Date()})
+            elif pa.types.is_decimal(arrow_type):
+                dtypedict.update({field.name: sqlalchemy.types.Numeric(precision=arrow_type.precision, scale=arrow_type.scale)})
+            elif pa.types.is_floating(arrow_type):
+                dtypedict.update({field.name: sqlalchemy.types.Numeric(precision=20, scale=6)})
+            elif pa.types.is_integer(arrow_type):
+                dtypedict.update({field.name: sqlalchemy.types.INT()})
+            elif pa.types.is_boolean(arrow_type):
+                dtypedict.update({field.name: sqlalchemy.types.Boolean()})
+
+        if len(custom_dtype) > 0:
+            for key, value in custom_dtype.items():
+                dtypedict.update({key: value})
+        return dtypedict
+
+    def generate_updated_time_column(self, df):
         utc_timezone = pytz.timezone("UTC")
         current_time_utc = datetime.now(utc_timezone)
+        if isinstance(df, pl.DataFrame):
+            return df.with_columns(pl.lit(current_time_utc).alias("updated_time_utc"))
+        if isinstance(df, pa.Table):
+            column = pa.repeat(pa.scalar(current_time_utc, type=pa.timestamp('us', tz='UTC')), df.num_rows)
+            if "updated_time_utc" in df.column_names:
+                return df.set_column(df.column_names.index("updated_time_utc"), "updated_time_utc", column)
+            return df.append_column("updated_time_utc", column)
         df["updated_time_utc"] = current_time_utc
         return df
 
-    def load_data(
+    def create_table(self, df, table_name: str, schema_name: str, if_exists: str, col_type: dict, conn):
+        """Create `table_name` from the columns of `df` (Pandas, Polars or Arrow) without writing rows."""
+        if isinstance(df, pl.DataFrame):
+            df = df.head(0).to_pandas()
+        elif isinstance(df, pa.Table):
+            df = df.schema.empty_table().to_pandas()
+        df.head(0).to_sql(name=table_name, con=conn, schema=schema_name, if_exists=if_exists, index=False, dtype=col_type)
+
+    def write_tsv(self, df: pd.DataFrame, path: str, chunksize: int = 100000):
+        """
+        Write `df` to `path` in the format LOAD DATA reads by default: tab separated, backslash
+        escaped, NULL as \\N, booleans as 0/1 and datetimes with microseconds. No header row.
+        """
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            for start in range(0, len(df), chunksize):
+                chunk = df.iloc[start:start + chunksize]
+                columns = []
+                for name, dtype in zip(chunk.columns, chunk.dtypes):
+                    series = chunk[name]
+                    null_mask = series.isna()
+                    if pd.api.types.is_datetime64_any_dtype(dtype):
+                        values = series.dt.strftime('%Y-%m-%d %H:%M:%S.%f')
+                    elif pd.api.types.is_bool_dtype(dtype):
+                        values = series.astype('Int8').astype(str)
+                    elif pd.api.types.is_numeric_dtype(dtype):
+                        values = series.astype(str)
+                    else:
+                        values = (
+                            series.astype(str)
+                            .str.replace('\\', '\\\\', regex=False)
+                            .str.replace('\t', '\\t', regex=False)
+                            .str.replace('\n', '\\n', regex=False)
+                            .str.replace('\r', '\\r', regex=False)
+                        )
+                    columns.append(values.where(~null_mask, '\\N').reset_index(drop=True))
+                if not columns:
+                    continue
+                lines = columns[0].str.cat(columns[1:], sep='\t') if len(columns) > 1 else columns[0]
+                f.write('\n'.join(lines))
+                f.write('\n')
+
+    def write_tsv_polars(self, df: pl.DataFrame, path: str):
+        """`write_tsv` for Polars DataFrames, escaped and formatted in Polars without converting to Pandas."""
+        expressions = []
+        for name, dtype in df.schema.items():
+            column = pl.col(name)
+            if dtype == pl.Categorical or dtype == pl.Enum:
+                column = column.cast(pl.String)
+                dtype = pl.String
+            if dtype == pl.String:
+                column = (
+                    column.str.replace_all('\\', '\\\\', literal=True)
+                    .str.replace_all('\t', '\\t', literal=True)
+                    .str.replace_all('\n', '\\n', literal=True)
+                    .str.replace_all('\r', '\\r', literal=True)
+                )
+            elif dtype == pl.Datetime:
+                column = column.dt.strftime('%Y-%m-%d %H:%M:%S%.6f')
+            elif dtype == pl.Boolean:
+                column = column.cast(pl.Int8)
+            elif dtype.is_float():
+                column = column.fill_nan(None)
+            expressions.append(column.alias(name))
+        df.select(expressions).write_csv(path, separator='\t', include_header=False, null_value='\\N', quote_style='never', line_terminator='\n')
+
+    def bulk_insert(self, df, table_name: str, schema_name: str, chunksize: int = 30000):
+        """
+        Append `df` to an existing table with LOAD DATA LOCAL INFILE.
+
+        Falls back to multi-row INSERTs when the engine was created without `allow_local_infile`
+        or the server refuses local infile. Raises ValueError, loading nothing, if the load produced
+        warnings such as truncated strings or invalid values.
+        """
+        if self.allow_local_infile:
+            fd, path = tempfile.mkstemp(suffix='.tsv')
+            os.close(fd)
+            try:
+                if isinstance(df, pl.DataFrame):
+                    self.write_tsv_polars(df, path)
+                else:
+                    self.write_tsv(df, path)
+                column_list = ', '.join(f"`{column}`" for column in df.columns)
+                load_sql = (
+                    f"LOAD DATA LOCAL INFILE :path INTO TABLE `{schema_name}`.`{table_name}` "
+                    "CHARACTER SET utf8mb4 FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+                    f"LINES TERMINATED BY '\\n' ({column_list})"
+                )
+                with self.database_engine().begin() as conn:
+                    conn.execute(sqlalchemy.text(load_sql), {'path': path.replace('\\', '/')})
+                    # LOAD DATA LOCAL acts as IGNORE: over-long strings are truncated and bad values
+                    # only warned about, so fail (and roll back) like the INSERT path would in strict mode
+                    warnings = [row for row in conn.execute(sqlalchemy.text("SHOW WARNINGS")) if row[0] != 'Note']
+                    if warnings:
+                        raise ValueError(
+                            f"LOAD DATA into `{schema_name}`.`{table_name}` produced {len(warnings)} warnings: "
+                            + '; '.join(f"{level} {code}: {message}" for level, code, message in warnings[:5])
+                        )
+                return
+            except sqlalchemy.exc.DBAPIError as error:
+                # Only a refused local infile falls back, data and connection errors are real failures
+                if getattr(error.orig, 'errno', None) not in LOCAL_INFILE_REFUSED:
+                    raise
+            finally:
+                os.remove(path)
+        with self.database_engine().begin() as conn:
+            if isinstance(df, pl.DataFrame):
+                table = sqlalchemy.table(table_name, *[sqlalchemy.column(name) for name in df.columns], schema=schema_name)
+                df = df.with_columns(pl.col(pl.Float32, pl.Float64).fill_nan(None))
+                for chunk in df.iter_slices(chunksize):
+                    conn.execute(table.insert(), chunk.rows(named=True))
+            else:
+                df.to_sql(name=table_name, con=conn, schema=schema_name, if_exists='append', index=False, chunksize=chunksize, method='multi')
+
+    def ensure_unique_index(self, table_name: str, schema_name: str, key_columns: list):
+        """Create a unique index on `key_columns` unless the table already has one (or a primary key) on exactly those columns."""
+        query = sqlalchemy.text(
+            "SELECT index_name, GROUP_CONCAT(column_name ORDER BY seq_in_index) AS columns "
+            "FROM information_schema.statistics "
+            "WHERE table_schema = :schema_name AND table_name = :table_name AND non_unique = 0 "
+            "GROUP BY index_name"
+        )
+        wanted = {column.lower() for column in key_columns}
+        with self.database_engine().begin() as conn:
+            for index_name, columns in conn.execute(query, {'schema_name': schema_name, 'table_name': table_name}):
+                if {column.lower() for column in columns.split(',')} == wanted:
+                    return
+            index_name = f"uq_{table_name}_{'_'.join(key_columns)}"[:64]
+            column_list = ', '.join(f"`{column}`" for column in key_columns)
+            conn.execute(sqlalchemy.text(f"ALTER TABLE `{schema_name}`.`{table_name}` ADD UNIQUE INDEX `{index_name}` ({column_list})"))
+
+    def upsert(
             self,
             df: pd.DataFrame,
             table_name: str,
             schema_name: str,
-            method='replace', #replace/append
+            key_columns: list,
+            col_type: dict,
+            watermark_column: str = None,
+            bulk: bool = False,
+            chunksize: int = 30000,
+            ):
+        """
+        Insert new rows and update existing ones, matched on `key_columns`.
+
+        The frame is loaded into `<table>__upsert` and merged with INSERT ... SELECT ... ON DUPLICATE KEY UPDATE.
+        With `watermark_column` an existing row is only overwritten when the incoming watermark is not older.
+        """
+        staging_table = f"{table_name}__upsert"
+        with self.database_engine().begin() as conn:
+            self.create_table(df, table_name, schema_name, 'append', col_type, conn)
+            self.create_table(df, staging_table, schema_name, 'replace', col_type, conn)
+        self.ensure_unique_index(table_name, schema_name, key_columns)
+        try:
+            if bulk:
+                self.bulk_insert(df, staging_table, schema_name, chunksize)
+            else:
+                with self.database_engine().begin() as conn:
+                    df.to_sql(name=staging_table, con=conn, schema=schema_name, if_exists='append', index=False, chunksize=chunksize)
+
+            # Target columns are qualified, the staging select shares their names
+            target = f"`{schema_name}`.`{table_name}`"
+            update_columns = [column for column in df.columns if column not in key_columns and column != watermark_column]
+            if watermark_column:
+                # The watermark is assigned last: MySQL applies assignments left to right, so every
+                # earlier comparison still sees the stored watermark
+                update_columns.append(watermark_column)
+                stored = f"{target}.`{watermark_column}`"
+                condition = f"VALUES(`{watermark_column}`) >= {stored} OR {stored} IS NULL"
+                assignments = [
+                    f"{target}.`{column}` = IF({condition}, VALUES(`{column}`), {target}.`{column}`)" for column in update_columns
+                ]
+            else:
+                assignments = [f"{target}.`{column}` = VALUES(`{column}`)" for column in update_columns or key_columns]
+            column_list = ', '.join(f"`{column}`" for column in df.columns)
+            merge_sql = (
+                f"INSERT INTO {target} ({column_list}) "
+                f"SELECT {column_list} FROM `{schema_name}`.`{staging_table}` "
+                f"ON DUPLICATE KEY UPDATE {', '.join(assignments)}"
+            )
+            with self.database_engine().begin() as conn:
+                conn.execute(sqlalchemy.text(merge_sql))
+        finally:
+            with self.database_engine().begin() as conn:
+                conn.execute(sqlalchemy.text(f"DROP TABLE IF EXISTS `{schema_name}`.`{staging_table}`"))
+
+    def load_data(
+            self,
+            df: pd.DataFrame | pl.DataFrame | pa.Table,
+            table_name: str,
+            schema_name: str,
+            method='replace', #replace/append/upsert
             generate_updated_time_column: bool = True,
             custom_dtype: dict = {},
+            bulk: bool = False,
+            chunksize: int = 30000,
+            key_columns: list = [],
+            watermark_column: str = None,
             ): 
-        if generate_updated_time_column:
+        """
+        Write `df` to `schema_name`.`table_name`.
+
+        With `bulk=True` the rows go through LOAD DATA LOCAL INFILE (multi-row INSERTs if local infile
+        is unavailable), and `replace` loads into a staging table that is swapped in with RENAME TABLE,
+        so readers never see an empty or half-loaded table.
+
+        `upsert` updates rows matching `key_columns` and inserts the rest, creating the unique index on
+        `key_columns` if it is missing. Pass `watermark_column` (e.g. a source `updated_time_utc`) to keep
+        stored rows that are newer than the incoming ones.
+
+        Polars DataFrames and pyarrow Tables are typed from their Arrow schema and always take the bulk
+        path, written out by Polars without converting to Pandas.
+        """
+        if isinstance(df, pa.Table):
+            df = pl.from_arrow(df)
+        if isinstance(df, pl.DataFrame):
+            bulk = True
+
+        # Checked after Polars/Arrow switch to bulk, where anything but append/upsert replaces the table
+        if method not in ('replace', 'append', 'upsert') and (bulk or method != 'fail'):
+            raise ValueError(f"Unknown method {method!r}, expected 'replace', 'append' or 'upsert'")
+        if method == 'upsert' and not key_columns:
+            raise ValueError("method='upsert' needs key_columns")
+
+        # Keep an incoming updated_time_utc when it is the watermark being compared
+        if generate_updated_time_column and not (watermark_column == "updated_time_utc" and watermark_column in df.columns):
             df = self.generate_updated_time_column(df)
 
         col_type = self.get_column_dtypes(df,custom_dtype)
 
-        with self.database_engine().connect() as conn:
-            df.to_sql(name=table_name,con=conn,schema=schema_name, if_exists=method, index=False, dtype=col_type, chunksize=30000)
+        if method == 'upsert':
+            self.upsert(df, table_name, schema_name, key_columns, col_type, watermark_column, bulk, chunksize)
+            return
+
+        if not bulk:
+            with self.database_engine().connect() as conn:
+                df.to_sql(name=table_name,con=conn,schema=schema_name, if_exists=method, index=False, dtype=col_type, chunksize=chunksize)
+            return
+
+        if method == 'append':
+            with self.database_engine().begin() as conn:
+                self.create_table(df, table_name, schema_name, 'append', col_type, conn)
+            self.bulk_insert(df, table_name, schema_name, chunksize)
+            return
+
+        staging_table = f"{table_name}__staging"
+        old_table = f"{table_name}__old"
+        with self.database_engine().begin() as conn:
+            conn.execute(sqlalchemy.text(f"DROP TABLE IF EXISTS `{schema_name}`.`{staging_table}`, `{schema_name}`.`{old_table}`"))
+            self.create_table(df, staging_table, schema_name, 'replace', col_type, conn)
+        try:
+            self.bulk_insert(df, staging_table, schema_name, chunksize)
+        except Exception:
+            with self.database_engine().begin() as conn:
+                conn.execute(sqlalchemy.text(f"DROP TABLE IF EXISTS `{schema_name}`.`{staging_table}`"))
+            raise
+        with self.database_engine().begin() as conn:
+            if sqlalchemy.inspect(conn).has_table(table_name, schema=schema_name):
+                conn.execute(sqlalchemy.text(
+                    f"RENAME TABLE `{schema_name}`.`{table_name}` TO `{schema_name}`.`{old_table}`, "
+                    f"`{schema_name}`.`{staging_table}` TO `{schema_name}`.`{table_name}`"
+                ))
+                conn.execute(sqlalchemy.text(f"DROP TABLE `{schema_name}`.`{old_table}`"))
+            else:
+                conn.execute(sqlalchemy.text(f"RENAME TABLE `{schema_name}`.`{staging_table}` TO `{schema_name}`.`{table_name}`"))
     
 
 
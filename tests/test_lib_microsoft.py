@@ -0,0 +1,222 @@
+import asyncio
+import json
+import time
+import pandas as pd
+import pytest
+import requests
+import lib_microsoft
+from lib_microsoft import TokenCache, ResolutionCache, DownloadCache, token_cache
+from lib_microsoft_async import async_microsoft_sharepoint
+from fake_graph_server import FakeGraphServer, csv_bytes
+
+def test_token_cache_reuses_token_until_refresh_margin(server, sp):
+    sp.get_token()
+    sp.get_token()
+    assert server.stats()['by_route'] == {'token': 1}
+    assert token_cache.stats()['hits'] == 1
+
+    other = server.client(client_id='other-client')
+    other.get_token()
+    assert server.stats()['by_route'] == {'token': 2}
+
+    cache = TokenCache(refresh_margin=300)
+    cache.store('key', 'token', expires_in=100)
+    assert cache.lookup('key') is None
+    cache.store('key', 'token', expires_in=3600)
+    assert cache.lookup('key') == 'token'
+
+def test_resolution_cache_ttl_and_invalidation(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(lib_microsoft.time, 'time', lambda: now[0])
+    cache = ResolutionCache(max_entries=2, ttl=10)
+    cache.update('a', id='1', path='x/a.csv')
+    assert cache.get('a') == {'id': '1', 'path': 'x/a.csv'}
+    assert cache.update('a', eTag='e') == {'id': '1', 'path': 'x/a.csv', 'eTag': 'e'}
+    now[0] += 11
+    assert cache.get('a') is None
+
+    cache.update('a', id='1', path='x/a.csv')
+    cache.update('b', id='2', path='x/b.csv')
+    cache.invalidate(None, path='x/a.csv')
+    assert cache.get('a') is None and cache.get('b') is not None
+    cache.update('c', id='3')
+    cache.update('d', id='4')
+    assert cache.get('b') is None
+
+def test_search_item_details_is_cached_until_upload(server, sp, tmp_path, monkeypatch):
+    server.add_file('Shared Document/F/a.csv', csv_bytes(100))
+    first = sp.search_item_details(filePath='Shared Document/F/a.csv')
+    assert sp.search_item_details(filePath='Shared Document/F/a.csv') == first
+    assert server.stats()['by_route'].get('metadata') == 1
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'a.csv').write_bytes(csv_bytes(200))
+    assert sp.upload_item(fileName='a.csv', parentFolderName='Shared Document/F', fileLocated='')
+    sp.search_item_details(filePath='Shared Document/F/a.csv')
+    assert server.stats()['by_route'].get('metadata') == 2
+
+def test_download_cache_refreshes_on_ctag_change(server, tmp_path):
+    server.add_file('Shared Document/F/a.csv', b'id\n1\n')
+    sp = server.client(cache_dir=str(tmp_path))
+    assert sp.read_item2(filePath='Shared Document/F/a.csv')['id'].tolist() == [1]
+    assert sp.read_item2(filePath='Shared Document/F/a.csv')['id'].tolist() == [1]
+    assert server.stats()['by_route'].get('download') == 1
+
+    server.add_file('Shared Document/F/a.csv', b'id\n2\n')
+    assert sp.read_item2(filePath='Shared Document/F/a.csv')['id'].tolist() == [2]
+    assert server.stats()['by_route'].get('download') == 2
+
+def test_download_cache_eviction_keeps_entry_just_written(server, tmp_path):
+    server.add_file('Shared Document/F/a.csv', csv_bytes(3000))
+    server.add_file('Shared Document/F/b.csv', csv_bytes(3000))
+    sp = server.client(cache_dir=str(tmp_path), cache_max_bytes=4000)
+    assert len(sp.read_item(fileName='a.csv', parentFolderName='Shared Document/F')) > 0
+    assert len(sp.read_item(fileName='b.csv', parentFolderName='Shared Document/F')) > 0
+    cached = [path.name for path in tmp_path.iterdir() if path.name != 'index.json']
+    assert len(cached) == 1
+
+    cache = DownloadCache(str(tmp_path / 'small'), max_bytes=10)
+    path = cache.put('item', 'ctag', lambda temp_path: open(temp_path, 'wb').write(b'x' * 100))
+    assert cache.get('item', 'ctag') == path
+
+def test_update_same_file_beyond_26_columns_and_append(server, sp):
+    df = pd.DataFrame([[row * 100 + column for column in range(30)] for row in range(5)])
+    assert sp.update_same_file(df, fileName='Book.xlsx', parentFolderName='Shared Document/F', block_rows=2) == 200
+    assert sorted(write['address'] for write in server.range_writes) == ['A2:AD3', 'A4:AD5', 'A6:AD6']
+    assert next(write for write in server.range_writes if write['address'] == 'A6:AD6')['values'] == [df.iloc[4].tolist()]
+
+    server.range_writes.clear()
+    assert sp.update_same_file(df.head(3), fileName='Book.xlsx', parentFolderName='Shared Document/F', append=True) == 200
+    assert [write['address'] for write in server.range_writes] == ['A7:AD9']
+
+def test_chunked_upload_resumes_after_lost_acknowledgement(server, sp, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(lib_microsoft.time, 'sleep', lambda seconds: None)
+    data = csv_bytes(800 * 1024)
+    (tmp_path / 'big.csv').write_bytes(data)
+    server.fail_chunks = 1
+    assert sp.upload_item(fileName='big.csv', parentFolderName='Shared Document/F', fileLocated='', large_file=True, chunk_size=320 * 1024)
+    assert server.files['Shared Document/F/big.csv'] == data
+    # Only the acknowledged-but-lost range is asked for again, nothing is sent twice
+    assert server.stats()['by_route']['chunk_status'] == 1
+    assert server.stats()['by_route']['chunk'] == 3
+
+def test_graph_batch_retries_throttled_sub_requests(server, sp, monkeypatch):
+    monkeypatch.setattr(lib_microsoft.time, 'sleep', lambda seconds: None)
+    batch_requests = [{'id': str(i), 'method': 'DELETE', 'url': f'/groups/g/members/{i}/$ref'} for i in range(25)]
+    server.throttled_batch_ids = {'3', '21'}
+    responses = sp.graph_batch(batch_requests)
+    assert {response['status'] for response in responses.values()} == {204}
+    # 25 sub-requests take two $batch calls, the two throttled ones a third
+    assert server.stats()['by_route']['batch'] == 3
+
+def test_async_client_against_fake_server(server, sp, tmp_path, monkeypatch):
+    server.add_file('Shared Document/F/a.csv', b'id,name\n1,x\n2,y\n')
+    server.add_groups(2, members_per_group=3)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'up.csv').write_bytes(b'id\n1\n')
+
+    async def run():
+        async with async_microsoft_sharepoint(sp, max_concurrency=4) as client:
+            files = await client.list_files(parentFolderName='Shared Document/F')
+            frames = await asyncio.gather(*(client.read_item2(filePath='Shared Document/F/a.csv') for _ in range(3)))
+            item_id = await client.search_item_details(filePath='Shared Document/F/a.csv')
+            uploaded = await client.upload_item(fileName='up.csv', parentFolderName='Shared Document/F', fileLocated='')
+            members = await client.get_groupmember_details(group_name=['Group 0', 'Group 1'])
+            return files, frames, item_id, uploaded, members
+
+    files, frames, item_id, uploaded, members = asyncio.run(run())
+    assert files == ['a.csv']
+    assert all(frame['name'].tolist() == ['x', 'y'] for frame in frames)
+    assert item_id == sp.search_item_details(filePath='Shared Document/F/a.csv')
+    assert uploaded and server.files['Shared Document/F/up.csv'] == b'id\n1\n'
+    assert len(members) == 6 and set(members['groupName']) == {'Group 0', 'Group 1'}
+
+def test_audit_failures_do_not_reach_callers(server, sp):
+    def failing_writer(records):
+        raise RuntimeError('log workbook unavailable')
+    sp.audit_sink.writer = failing_writer
+    sp.audit_sink.batch_size = 1
+    server.add_file('Shared Document/F/a.csv', b'id\n1\n')
+    started = time.time()
+    assert sp.list_files(parentFolderName='Shared Document/F') == ['a.csv']
+    assert sp.list_files(parentFolderName='Shared Document/F') == ['a.csv']
+    assert sp.audit_sink.failures == 1 and len(sp.audit_sink._buffer) == 2
+    assert time.time() - started < 5
+    sp.audit_sink.writer = None
+
+def test_sync_folder_delta_shares_drive_state_between_folders(server, sp, tmp_path):
+    server.page_size = 3
+    server.add_files('Shared Document/A', 2)
+    server.add_files('Shared Document/B', 2)
+    state_file = str(tmp_path / 'delta.json')
+
+    def paths(result):
+        return {change: sorted(item['path'] for item in items) for change, items in result.items()}
+
+    assert paths(sp.sync_folder_delta('Shared Document/A', state_file))['added'] == ['Shared Document/A/file000000.csv', 'Shared Document/A/file000001.csv']
+    assert len(sp.sync_folder_delta('Shared Document/B', state_file)['added']) == 2
+
+    server.add_file('Shared Document/A/file000000.csv', b'id\n1\n')
+    server.remove_file('Shared Document/B/file000001.csv')
+    assert paths(sp.sync_folder_delta('Shared Document/A', state_file)) == {'added': [], 'modified': ['Shared Document/A/file000000.csv'], 'deleted': []}
+    # A's call advanced the shared delta link, B still sees its own changes
+    assert paths(sp.sync_folder_delta('Shared Document/B', state_file)) == {'added': [], 'modified': [], 'deleted': ['Shared Document/B/file000001.csv']}
+    assert paths(sp.sync_folder_delta('Shared Document/B', state_file)) == {'added': [], 'modified': [], 'deleted': []}
+
+    with open(state_file, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+    assert list(state) == [server.site_id]
+    assert set(state[server.site_id]['folders']) == {'Shared Document/A', 'Shared Document/B'}
+
+def test_read_items_reports_missing_files(server, sp, tmp_path):
+    server.add_file('Shared Document/F/a.csv', b'id\n1\n')
+    for client in (sp, server.client(cache_dir=str(tmp_path))):
+        df, failures = client.read_items(['Shared Document/F/a.csv', 'Shared Document/F/missing.csv'])
+        assert df['id'].tolist() == [1]
+        assert list(failures) == ['Shared Document/F/missing.csv']
+
+def test_delete_item_invalidates_cached_lookups(server, sp):
+    server.add_file('Shared Document/F/a.csv', b'id\n1\n')
+    assert sp.search_item_details(filePath='Shared Document/F/a.csv')
+    list_item_id = int(server.library_items['Shared Document/F/a.csv'])
+    assert sp.delete_item(fileID=list_item_id) is True
+    assert sp.search_item_details(filePath='Shared Document/F/a.csv')[0] is False
+
+def test_async_client_retries_throttled_requests():
+    with FakeGraphServer(throttle_every=2, retry_after=0) as server:
+        server.add_files('Shared Document/F', 5)
+        sp = server.client()
+
+        async def run():
+            async with async_microsoft_sharepoint(sp, max_concurrency=4) as client:
+                files = await client.list_files(parentFolderName='Shared Document/F')
+                frame = await client.read_item2(filePath='Shared Document/F/file000000.csv')
+                missing = await client.read_item2(filePath='Shared Document/F/missing.csv')
+                return files, frame, missing
+
+        files, frame, missing = asyncio.run(run())
+        assert files == sp.list_files(parentFolderName='Shared Document/F') == [f'file{i:06d}.csv' for i in range(5)]
+        assert frame.equals(sp.read_item2(filePath='Shared Document/F/file000000.csv'))
+        assert missing[0] is False
+        sp.close()
+
+def test_get_file_path_keeps_walk_order(server, sp):
+    for path in ['Shared Document/T/b.csv', 'Shared Document/T/a/z.csv', 'Shared Document/T/a/c/x.csv', 'Shared Document/T/a.csv', 'Shared Document/T/b/y.csv']:
+        server.add_file(path, b'id\n1\n')
+    expected = [
+        'Shared Document/T/a.csv', 'Shared Document/T/b.csv',
+        'Shared Document/T/a/z.csv', 'Shared Document/T/a/c/x.csv', 'Shared Document/T/b/y.csv',
+    ]
+    for _ in range(3):
+        assert sp.get_file_path(None, 'Shared Document/T', layer=3) == expected
+    assert sp.get_file_path(None, 'Shared Document/T') == expected[:2]
+
+def test_failed_group_refresh_keeps_directory_stale(server, sp):
+    server.add_groups(1)
+    server.route_errors['groups'] = 403
+    with pytest.raises(requests.HTTPError):
+        sp.group_id('Group 0')
+    assert sp.directory.groups_stale()
+    del server.route_errors['groups']
+    assert sp.group_id('Group 0') == 'group-00000'
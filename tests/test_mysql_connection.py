@@ -0,0 +1,113 @@
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+import mysql_connection
+from mysql_connection import MySQL
+
+@pytest.fixture
+def db(monkeypatch):
+    db = MySQL('localhost', 'user', 'password', 3306)
+    def no_engine():
+        raise AssertionError('no statement should reach the server')
+    monkeypatch.setattr(db, 'database_engine', no_engine)
+    return db
+
+@pytest.mark.parametrize('df', [pl.DataFrame({'id': [1]}), pa.table({'id': [1]})])
+def test_load_data_rejects_fail_for_bulk_only_frames(db, df):
+    with pytest.raises(ValueError, match="Unknown method 'fail'"):
+        db.load_data(df, 't', 's', method='fail')
+
+def write_sql(tmp_path, sql):
+    path = tmp_path / 'query.sql'
+    path.write_text(sql, encoding='utf-8')
+    return str(path)
+
+def test_bound_statement_evaluates_tags_with_real_values(db, tmp_path):
+    file_name = write_sql(
+        tmp_path,
+        "SELECT * FROM t WHERE region = {{ region }}{% if mode == 'x' %} AND x = 1{% endif %}"
+        "{% if limit > 0 %} LIMIT {{ limit }} OFFSET {{ limit * 2 }}{% endif %}"
+    )
+    assert db.bound_statement(file_name, {'region': 'EU', 'mode': 'x', 'limit': 10}) == (
+        "SELECT * FROM t WHERE region = :region AND x = 1 LIMIT :limit OFFSET :_expr2",
+        {'region': 'EU', 'limit': 10, '_expr2': 20},
+    )
+    assert db.bound_statement(file_name, {'region': 'EU', 'mode': 'y', 'limit': 0}, 'format') == (
+        "SELECT * FROM t WHERE region = %s", ['EU'],
+    )
+
+def test_bound_statement_binds_expressions_and_inlines_list_items(db, tmp_path):
+    file_name = write_sql(
+        tmp_path,
+        "SELECT {% for column in columns %}{{ column }}{% if not loop.last %}, {% endif %}{% endfor %} "
+        "FROM t WHERE region = {{ region|upper }} AND n = {{ n }}"
+    )
+    assert db.bound_statement(file_name, {'columns': ['a', 'b'], 'region': 'eu', 'n': '5'}, 'format') == (
+        "SELECT a, b FROM t WHERE region = %s AND n = %s", ['EU', 5],
+    )
+
+def test_read_sql_file_chunks_binds_parameters(db, tmp_path, monkeypatch):
+    file_name = write_sql(tmp_path, "SET @cutoff = {{ cutoff }};\nSELECT * FROM t WHERE region = {{ region }} AND d > @cutoff")
+    executed, streamed = [], []
+
+    class Connection:
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc_info):
+            return False
+        def exec_driver_sql(self, statement, params):
+            executed.append((statement, params))
+        def commit(self):
+            pass
+
+    class Engine:
+        def connect(self):
+            return Connection()
+
+    def stream_statement(conn, statement, chunksize, df_type='pd', params=None):
+        streamed.append((statement, params))
+        yield pl.DataFrame({'id': [1]})
+
+    monkeypatch.setattr(db, 'database_engine', Engine)
+    monkeypatch.setattr(db, 'stream_statement', stream_statement)
+    chunks = list(db.read_sql_file_chunks(file_name, {'cutoff': '2024-01-01', 'region': "o'brien"}))
+    assert len(chunks) == 1
+    assert executed == [("SET @cutoff = %s", ('2024-01-01',))]
+    assert streamed == [("SELECT * FROM t WHERE region = %s AND d > @cutoff", ("o'brien",))]
+
+def test_bulk_insert_raises_on_load_data_warnings(monkeypatch):
+    db = MySQL('localhost', 'user', 'password', 3306, allow_local_infile=True)
+    executed = []
+
+    class Connection:
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc_info):
+            return False
+        def execute(self, statement, params=None):
+            executed.append(str(statement))
+            if str(statement) == 'SHOW WARNINGS':
+                return [('Note', 1051, 'Unknown table'), ('Warning', 1265, "Data truncated for column 'name' at row 1")]
+            return []
+
+    class Engine:
+        def begin(self):
+            return Connection()
+
+    monkeypatch.setattr(db, 'database_engine', Engine)
+    with pytest.raises(ValueError, match="1 warnings: Warning 1265: Data truncated for column 'name'"):
+        db.bulk_insert(pd.DataFrame({'name': ['x' * 300]}), 't', 's')
+    assert executed[0].startswith('LOAD DATA LOCAL INFILE') and len(executed) == 2
+
+def test_connx_partitions_only_on_a_selected_primary_key(db, tmp_path, monkeypatch):
+    looked_up, reads = [], []
+    monkeypatch.setattr(db, 'numeric_primary_key', lambda table_name: looked_up.append(table_name) or 'id')
+    monkeypatch.setattr(mysql_connection.cx, 'read_sql', lambda url, query, return_type, **kwargs: reads.append(kwargs))
+
+    with pytest.raises(ValueError, match='pass partition_on'):
+        db.connx(write_sql(tmp_path, "SELECT name FROM db.t"), partition_num=4)
+
+    db.connx(write_sql(tmp_path, "SELECT EXTRACT(YEAR FROM created) AS y, id FROM db.t"), partition_num=4)
+    assert looked_up == ['db.t', 'db.t']
+    assert reads == [{'partition_on': 'id', 'partition_num': 4}]